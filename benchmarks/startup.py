@@ -0,0 +1,111 @@
+"""
+Startup benchmark for 32O - Eye Protection.
+
+Reports time-to-first-paint (process spawn until the first frame is on
+screen) and the import cost of every module loaded at startup, plus the
+cost of the modules main.py preloads in the background afterwards.
+
+    python benchmarks/startup.py                    # run from source
+    python benchmarks/startup.py --exe dist/main.exe   # PyInstaller build
+    python benchmarks/startup.py --runs 10 --json startup.json
+
+Needs a display for the first-paint part (use xvfb-run on a headless box).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# modules that should never be imported before the first paint
+HEAVY_MODULES = ["numpy", "cv2", "pydub", "pygame", "components.alarm",
+                 "components.break_screen", "utils.camera"]
+
+
+def time_to_first_paint(command, runs):
+    """Spawn the app `runs` times; main.py writes a timestamp once painted."""
+    results = []
+    for _ in range(runs):
+        fd, stamp_path = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        env = dict(os.environ, EYECARE_STARTUP_BENCH=stamp_path)
+        try:
+            start = time.time()
+            subprocess.run(command, cwd=ROOT, env=env, timeout=120,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            with open(stamp_path) as f:
+                text = f.read().strip()
+            if text:
+                results.append(float(text) - start)
+        finally:
+            os.remove(stamp_path)
+    return results
+
+
+def import_times(code):
+    """Run code under -X importtime; return {module: (self_us, cumulative_us)}."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True, timeout=120)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def summarize(values):
+    if not values:
+        return None
+    return {"runs": len(values), "min_ms": round(min(values) * 1000, 1),
+            "median_ms": round(statistics.median(values) * 1000, 1),
+            "max_ms": round(max(values) * 1000, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--exe", help="time a built executable instead of main.py")
+    parser.add_argument("--top", type=int, default=15, help="modules to list by import cost")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--no-paint", action="store_true", help="skip the first-paint runs")
+    args = parser.parse_args()
+
+    report = {"python": sys.version.split()[0], "platform": sys.platform}
+
+    if not args.no_paint:
+        command = [args.exe] if args.exe else [sys.executable, os.path.join(ROOT, "main.py")]
+        report["first_paint"] = summarize(time_to_first_paint(command, args.runs))
+
+    startup = import_times("import main")
+    report["startup_imports_ms"] = round(sum(s for s, _ in startup.values()) / 1000, 1)
+    report["startup_top_modules"] = [
+        {"module": name, "self_ms": round(s / 1000, 1), "cumulative_ms": round(c / 1000, 1)}
+        for name, (s, c) in sorted(startup.items(), key=lambda kv: kv[1][0], reverse=True)[:args.top]
+    ]
+    report["heavy_modules_at_startup"] = [m for m in HEAVY_MODULES if m in startup]
+
+    # __import__ rather than importlib.import_module: only the former is
+    # measured by -X importtime
+    preload = import_times("import main\n"
+                           "for m in main.PRELOAD_MODULES: __import__(m)")
+    loaded_later = {name: t for name, t in preload.items() if name not in startup}
+    report["preload_modules"] = [
+        {"module": name, "cumulative_ms": round(c / 1000, 1)}
+        for name, (_, c) in sorted(loaded_later.items(), key=lambda kv: kv[1][1], reverse=True)
+        if "." not in name or name.startswith(("utils.", "components."))
+    ][:args.top]
+
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Headless UI frame-time benchmark for 32O - Eye Protection.
+
+Drives EyeCareApp through main screen -> alarm overlay -> break screen ->
+post-break -> main screen under a virtual X server, with the camera replaced
+by a synthetic "looking away" feed and SDL audio on its dummy driver, and
+records:
+
+  * transition latency: from triggering a screen change until Tk has
+    processed every resulting event and redraw,
+  * after() callback durations (p50/p90/p99/max per callback),
+  * countdown jitter: how far the 1 s ticks of the work timer and the
+    break countdown drift from 1000 ms.
+
+    python benchmarks/ui_frames.py --json ui_frames.json
+    python benchmarks/ui_frames.py --cpu-load 4       # with 4 busy processes
+
+Starts Xvfb itself when DISPLAY is not set (the Xvfb binary must be on PATH).
+Compare the JSON files between versions to spot UI regressions.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+# -------------------------
+# Environment
+# -------------------------
+def start_xvfb(display=":99"):
+    if not shutil.which("Xvfb"):
+        raise SystemExit("DISPLAY is not set and Xvfb was not found on PATH")
+    proc = subprocess.Popen(["Xvfb", display, "-screen", "0", "1600x1000x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(1.0)
+    if proc.poll() is not None:
+        raise SystemExit("Xvfb failed to start")
+    return proc
+
+
+def _burn():
+    while True:
+        pass
+
+
+def start_cpu_load(processes):
+    workers = []
+    for _ in range(processes):
+        p = multiprocessing.Process(target=_burn, daemon=True)
+        p.start()
+        workers.append(p)
+    return workers
+
+
+def stub_camera():
+    """Replace the camera with a synthetic feed of a user looking away."""
+    import numpy as np
+    import utils.camera as camera
+
+    frame = np.tile(np.linspace(40, 200, 640, dtype=np.uint8), (480, 1))
+    frame = np.dstack([frame, frame, frame])
+
+    def fake_is_user_peeking():
+        time.sleep(0.01)  # roughly one cascade pass
+        return False, {'frame': frame.copy(), 'face_detected': False, 'peeking': False,
+                       'message': "No face detected", 'vert_angle': 0, 'horiz_angle': 0,
+                       'landmarks': [], 'is_black': False}
+
+    camera.is_user_peeking = fake_is_user_peeking
+
+
+# -------------------------
+# Instrumentation
+# -------------------------
+class Recorder:
+    def __init__(self):
+        self.callbacks = {}
+        self.ticks = {}
+        self.transitions = {}
+
+    def wrap_after(self, app):
+        original_after = app.after
+        recorder = self
+
+        def after(ms, func=None, *args):
+            if func is None:
+                return original_after(ms)
+            name = getattr(func, "__qualname__", repr(func))
+
+            def timed(*a):
+                start = time.perf_counter()
+                if name.endswith(("tick", "update")):
+                    recorder.ticks.setdefault(name, []).append(start)
+                try:
+                    return func(*a)
+                finally:
+                    recorder.callbacks.setdefault(name, []).append(time.perf_counter() - start)
+            return original_after(ms, timed, *args)
+
+        app.after = after
+
+    def transition(self, app, name, trigger):
+        start = time.perf_counter()
+        trigger()
+        app.update_idletasks()
+        app.update()
+        self.transitions[name] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def percentiles(values_s):
+    values = sorted(v * 1000 for v in values_s)
+    if not values:
+        return None
+
+    def pct(p):
+        return round(values[min(len(values) - 1, int(p / 100 * len(values)))], 3)
+    return {"count": len(values), "p50_ms": pct(50), "p90_ms": pct(90),
+            "p99_ms": pct(99), "max_ms": round(values[-1], 3)}
+
+
+def jitter(timestamps):
+    intervals = [(b - a) * 1000 for a, b in zip(timestamps, timestamps[1:])]
+    # only the steady 1 s cadence counts; restarts after resets are not jitter
+    intervals = [i for i in intervals if 500 < i < 1500]
+    if not intervals:
+        return None
+    deviations = [abs(i - 1000) for i in intervals]
+    return {"intervals": len(intervals), "mean_interval_ms": round(statistics.mean(intervals), 2),
+            "mean_abs_jitter_ms": round(statistics.mean(deviations), 2),
+            "max_abs_jitter_ms": round(max(deviations), 2)}
+
+
+def pump(app, seconds, until=None):
+    """Run the Tk event loop for a while (or until a condition holds)."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.update()
+        if until and until():
+            return True
+        time.sleep(0.001)
+    return False
+
+
+# -------------------------
+# Scenario
+# -------------------------
+def run(args):
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.chdir(ROOT)
+    stub_camera()
+
+    import main
+    from config.session import session, PHASE_POST_BREAK
+    from components.alarm import show_alarm_overlay
+    from components import break_screen
+
+    recorder = Recorder()
+    start = time.perf_counter()
+    app = main.EyeCareApp()
+    recorder.wrap_after(app)
+    app.update()
+    recorder.transitions["startup"] = round((time.perf_counter() - start) * 1000, 2)
+    main.get_audio_service().wait_ready(10)
+
+    # main screen: let the work timer tick
+    recorder.transition(app, "start_timer", app.timer.start_20min_timer)
+    pump(app, args.work_seconds)
+
+    # timer reaches zero -> alarm overlay
+    app.timer.timer_running = False
+    recorder.transition(app, "alarm_overlay", lambda: show_alarm_overlay(app))
+    pump(app, args.alarm_seconds)
+
+    # start break -> camera/break screen, then wait for the countdown
+    recorder.transition(app, "break_screen", lambda: break_screen.handle_continue_in_main(app))
+    break_start = time.perf_counter()
+    completed = pump(app, 40, until=lambda: session.get("phase") == PHASE_POST_BREAK)
+    recorder.transitions["break_countdown_total"] = round((time.perf_counter() - break_start) * 1000, 2)
+    pump(app, 1)
+
+    # continue working -> main screen
+    recorder.transition(app, "post_break_to_main", lambda: break_screen.restart_20min_main(app))
+    pump(app, 1)
+
+    app.timer.timer_running = False
+    app.destroy()
+
+    ticks = {name: jitter(stamps) for name, stamps in recorder.ticks.items()}
+    return {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cpu_load_processes": args.cpu_load,
+        "break_completed": completed,
+        "transitions_ms": recorder.transitions,
+        "callbacks": {name: percentiles(v) for name, v in sorted(recorder.callbacks.items())},
+        "countdown_jitter": {name: j for name, j in ticks.items() if j},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--cpu-load", type=int, default=0, help="busy processes to run alongside")
+    parser.add_argument("--work-seconds", type=float, default=5)
+    parser.add_argument("--alarm-seconds", type=float, default=2)
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if not os.environ.get("DISPLAY") else None
+    load = start_cpu_load(args.cpu_load)
+    try:
+        results = run(args)
+    finally:
+        for p in load:
+            p.terminate()
+        if xvfb:
+            xvfb.terminate()
+
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
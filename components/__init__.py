@@ -1,7 +1,22 @@
-from .timer import Timer
-from .alarm import *
-from .break_screen import *
-from .main_screen import *
+# Screens are imported on first use: break_screen pulls in OpenCV and NumPy,
+# which the main screen doesn't need at startup.
+import importlib
+
+_EXPORTS = {
+    'Timer': 'timer',
+    'play_alarm_loop': 'alarm',
+    'stop_alarm': 'alarm',
+    'show_alarm_overlay': 'alarm',
+    'create_alarm_overlay': 'break_screen',
+    'load_main_screen': 'main_screen',
+    'open_stats_window': 'stats_screen',
+}
 
 __all__ = ['Timer', 'play_alarm_loop', 'stop_alarm', 'show_alarm_overlay', 
-           'create_alarm_overlay', 'load_main_screen']
\ No newline at end of file
+           'create_alarm_overlay', 'load_main_screen', 'open_stats_window']
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,54 +1,196 @@
 import time
-import pygame
 import os
 import threading
-from config.paths import resource_path, DEFAULT_ALARM, NATURE_FILES
+from config.paths import DEFAULT_ALARM, SOUNDS_DIR, USER_SOUNDS_DIR
 from config.settings import load_settings
-from config.globals import nature_index, alarm_active, alarm_start_time
+from config.session import session, PHASE_ALARM
+from utils.sound_cache import get_sound
+from utils.sound_library import get_sound_library
+from utils.tones import is_tone, get_tone_sound
+from utils.audio_service import get_audio_service
+from utils.ui_dispatch import post_to_ui
 
-def play_alarm_loop(app):
-    global alarm_active, alarm_start_time
-    alarm_active = True
-    alarm_start_time = time.time()
-    settings = load_settings()
+# Alarm loop styles (settings["alarm_loop_style"])
+LOOP_REPEAT = 1       # play, wait, play again
+LOOP_CONTINUOUS = 2   # loop without gaps
+LOOP_ESCALATING = 3   # loop without gaps, getting louder
+
+ALARM_TIMEOUT_SECONDS = 60
+REPEAT_PERIOD_SECONDS = 5
+MIN_REPEAT_GAP_SECONDS = 1
+ESCALATE_START_VOLUME = 0.25
+ESCALATE_STEP = 0.15
+ESCALATE_INTERVAL_SECONDS = 5
+FALLBACK_TONE = "tone:chime"
+
+
+class AlarmEngine:
+    """
+    Plays the alarm from Tk timer deadlines instead of a polling thread.
+
+    Every step (next repeat, next volume level, timeout) is a single
+    app.after() deadline, so nothing runs between steps and stop() takes
+    effect immediately by cancelling the pending deadlines. Whether the
+    alarm is sounding is published as session "alarm_active". If the mixer
+    is still starting when the alarm fires, playback begins from an
+    on_ready() callback instead of blocking the Tk thread.
+    """
+    def __init__(self, app):
+        self.app = app
+        self.sound = None
+        self.channel = None
+        self.volume = 1.0
+        self.gain = 1.0
+        # pending deadline per step (repeat, escalate, timeout)
+        self._after_ids = {}
+        # bumped by stop(), so a deferred start for an old alarm is dropped
+        self._generation = 0
+
+    def start(self, source, style=LOOP_REPEAT, timeout=ALARM_TIMEOUT_SECONDS, on_finished=None):
+        self.stop()
+        session.update(alarm_active=True, alarm_start_time=time.time())
+        self._on_finished = on_finished
+        self._schedule(timeout, self._timeout)
 
-    def loop():
-        global nature_index
-        selected = settings["selected_alarm"]
-        if selected in settings.get("user_sounds", []):
-            path = resource_path(os.path.join("sounds", "user", selected))
+        audio = get_audio_service()
+        if audio.ready_for_playback(0):
+            self._begin(source, style, self._generation)
         else:
-            path = resource_path(os.path.join("sounds", selected))
+            generation = self._generation
+            audio.on_ready(lambda: post_to_ui(self._begin, source, style, generation))
+
+    def _begin(self, source, style, generation):
+        if generation != self._generation or not self.active:
+            return
+        try:
+            self.sound, self.gain = load_alarm_sound(source)
+        except Exception as e:
+            print("Alarm sound error:", e)
+            return
+
+        if style == LOOP_CONTINUOUS:
+            self._play(loops=-1, volume=1.0)
+        elif style == LOOP_ESCALATING:
+            self._play(loops=-1, volume=ESCALATE_START_VOLUME)
+            self._schedule(ESCALATE_INTERVAL_SECONDS, self._escalate)
+        else:
+            self._repeat()
+
+    def stop(self):
+        """Stop playback and cancel every pending deadline."""
+        self._generation += 1
+        for after_id in self._after_ids.values():
+            try:
+                self.app.after_cancel(after_id)
+            except Exception:
+                pass
+        self._after_ids = {}
+        if self.sound:
+            self.sound.stop()
+        session.update(alarm_active=False)
+
+    @property
+    def active(self):
+        return session.get("alarm_active")
+
+    def _play(self, loops=0, volume=1.0):
+        self.volume = volume
+        self.channel = self.sound.play(loops)
+        if self.channel:
+            self.channel.set_volume(volume * self.gain)
 
-        if not os.path.exists(path):
-            print("Alarm file missing. Reverting to default.")
-            path = DEFAULT_ALARM
+    def _schedule(self, seconds, callback):
+        # at most one pending deadline per step; ids are dropped once fired
+        name = callback.__name__
 
-        if settings.get("alarm_loop_style", 1) == 2:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play(-1)
+        def fire():
+            self._after_ids.pop(name, None)
+            callback()
+        self._after_ids[name] = self.app.after(int(seconds * 1000), fire)
 
-        while alarm_active:
-            if settings.get("alarm_loop_style", 1) == 1:
-                pygame.mixer.music.load(path)
-                pygame.mixer.music.play()
-                time.sleep(5)
-            if time.time() - alarm_start_time > 60:
-                break
-        pygame.mixer.music.stop()
-        app.after(0, lambda: show_continue_shutdown_buttons(app))
+    def _repeat(self):
+        if not self.active:
+            return
+        self._play()
+        # never start the next repeat before the current one has finished
+        period = max(REPEAT_PERIOD_SECONDS, self.sound.get_length() + MIN_REPEAT_GAP_SECONDS)
+        self._schedule(period, self._repeat)
+
+    def _escalate(self):
+        if not self.active:
+            return
+        self.volume = min(1.0, self.volume + ESCALATE_STEP)
+        if self.channel:
+            self.channel.set_volume(self.volume * self.gain)
+        if self.volume < 1.0:
+            self._schedule(ESCALATE_INTERVAL_SECONDS, self._escalate)
+
+    def _timeout(self):
+        self.stop()
+        if self._on_finished:
+            self._on_finished()
+
+
+def load_alarm_sound(source):
+    """Sound and playback gain for an alarm file path or a synthesized tone id."""
+    if is_tone(source):
+        return get_tone_sound(source), 1.0
+    sound = get_sound(source)
+    try:
+        library = get_sound_library()
+        if threading.current_thread() is threading.main_thread():
+            # no loudness decode on the Tk thread: use the stored gain, or
+            # unity until analyze_pending() / the audio warm-up stores one
+            entry = library.cached(source)
+            gain = entry.get("gain", 1.0) if entry else 1.0
+        else:
+            gain = library.gain(source)
+    except Exception as e:
+        print("Loudness lookup error:", e)
+        gain = 1.0
+    return sound, gain
+
+
+# Global engine instance
+alarm_engine = None
+
+def resolve_alarm_path(settings):
+    """File path of the selected alarm, or its tone id for synthesized alarms."""
+    selected = settings["selected_alarm"]
+    if is_tone(selected):
+        return selected
+    if selected in settings.get("user_sounds", []):
+        path = os.path.join(USER_SOUNDS_DIR, selected)
+    else:
+        path = os.path.join(SOUNDS_DIR, selected)
+
+    if not os.path.exists(path):
+        print("Alarm file missing. Reverting to default.")
+        path = DEFAULT_ALARM
+    if not os.path.exists(path):
+        # synthesized tones need no files, so the alarm always sounds
+        path = FALLBACK_TONE
+    return path
+
+def play_alarm_loop(app):
+    global alarm_engine
+    settings = load_settings()
+    source = resolve_alarm_path(settings)
 
-    threading.Thread(target=loop, daemon=True).start()
+    if alarm_engine is None or alarm_engine.app is not app:
+        alarm_engine = AlarmEngine(app)
+    alarm_engine.start(source, style=settings.get("alarm_loop_style", LOOP_REPEAT),
+                       on_finished=lambda: show_continue_shutdown_buttons(app))
 
 def stop_alarm():
-    global alarm_active
-    alarm_active = False
-    pygame.mixer.music.stop()
+    if alarm_engine:
+        alarm_engine.stop()
 
 def show_alarm_overlay(app):
     from components.break_screen import create_alarm_overlay
+    session.update(phase=PHASE_ALARM)
     create_alarm_overlay(app)
     play_alarm_loop(app)
 
 def show_continue_shutdown_buttons(app):
-    pass
\ No newline at end of file
+    pass
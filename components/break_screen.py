@@ -1,14 +1,8 @@
 import customtkinter as ctk
-import pygame
-import threading
-import cv2
-import numpy as np
-from PIL import Image
 from tkinter import Canvas
-from config.paths import NATURE_FILES
-from config.globals import nature_index
-from utils.camera import is_user_peeking
 from components.alarm import stop_alarm
+from config.session import session, PHASE_BREAK, PHASE_POST_BREAK
+from utils.ui_dispatch import post_to_ui
 
 # -------------------------
 # Theme / base settings
@@ -156,14 +150,27 @@ def create_alarm_overlay(app):
         anchor="w"
     ).pack(anchor="w", pady=(10, 6))
 
-    ctk.CTkLabel(
+    subtitle_label = ctk.CTkLabel(
         text_area,
         text="Please look away",
         font=fonts["subtitle"],
         text_color=COLORS["text_secondary"],
         wraplength=int(420 * get_scale(app)),
         anchor="w"
-    ).pack(anchor="w")
+    )
+    subtitle_label.pack(anchor="w")
+
+    # react when the alarm times out instead of polling its state
+    def on_alarm_active(_key, _old, active):
+        def _update():
+            try:
+                if not active and subtitle_label.winfo_exists():
+                    subtitle_label.configure(text="Alarm silenced — start your break when ready")
+            except Exception:
+                pass
+        post_to_ui(_update, key="alarm_subtitle")
+    unsubscribe = session.subscribe("alarm_active", on_alarm_active)
+    subtitle_label.bind("<Destroy>", lambda e: unsubscribe(), add="+")
 
     # buttons area (glass style)
     button_frame = ctk.CTkFrame(container, fg_color="transparent", border_width=0)
@@ -216,11 +223,11 @@ def create_alarm_overlay(app):
 # -------------------------
 def start_eye_break_main(app, reset=False):
     """Break screen with camera, countdown and progress arc."""
-    global nature_index
     fonts = scaled_fonts(app)
     main_frame = app.main_frame
 
     if not reset:
+        session.update(phase=PHASE_BREAK, break_resets=0)
         for w in main_frame.winfo_children():
             w.destroy()
 
@@ -348,24 +355,17 @@ def start_eye_break_main(app, reset=False):
             'nature_sound': None
         }
     else:
+        session.increment("break_resets")
         # reset values
         app.break_ui['canvas'].itemconfig(app.break_ui['counter_text_id'], text="20", fill=COLORS["primary"])
         app.break_ui['canvas'].itemconfig(app.break_ui['arc_id'], extent=0)
-        if app.break_ui['nature_sound']:
-            try:
-                app.break_ui['nature_sound'].stop()
-            except Exception:
-                pass
-            app.break_ui['nature_sound'] = None
 
-    # play nature sound if enabled
+    # play nature sound if enabled (streamed; keeps playing across resets)
     if app.settings.get("nature_sound", True):
         try:
-            current_nature_file = NATURE_FILES[nature_index % len(NATURE_FILES)]
-            nature_index += 1
-            nature_sound = pygame.mixer.Sound(str(current_nature_file))
-            nature_sound.set_volume(0.55)
-            nature_sound.play(-1)
+            from utils.ambient import get_ambient_player
+            nature_sound = get_ambient_player()
+            nature_sound.start()
             app.break_ui['nature_sound'] = nature_sound
         except Exception as e:
             print(f"Nature sound error: {e}")
@@ -384,6 +384,36 @@ def start_eye_break_main(app, reset=False):
         except Exception:
             pass
 
+    def set_counter_text(text):
+        app.break_ui['canvas'].itemconfig(app.break_ui['counter_text_id'], text=text)
+
+    # OpenCV/PIL are only needed once the camera preview runs
+    import cv2
+    from PIL import Image
+    from utils.camera import color_frame
+    from utils.look_events import get_look_monitor, LOOKED_BACK, LOW_LIGHT, STATE_LOOKING, STATE_LOW_LIGHT
+
+    # looking back at the screen (or the camera going dark) restarts the break
+    monitor = get_look_monitor()
+    if not reset:
+        def reset_break(text, message):
+            if session.get("phase") != PHASE_BREAK:
+                return
+            session.update(camera_status=message)
+            set_counter_text(text)
+            start_eye_break_main(app, reset=True)
+
+        def on_look_event(event):
+            if event.kind == LOOKED_BACK:
+                post_to_ui(reset_break, "Please\nLook\nAway", event.message, key="break_reset")
+            elif event.kind == LOW_LIGHT:
+                post_to_ui(reset_break, "Camera\nError", event.message, key="break_reset")
+
+        app.break_ui['look_unsubscribe'] = monitor.subscribe(on_look_event)
+        monitor.start()
+    # ticks of a break that has since been reset stop on their own
+    app.break_generation = generation = getattr(app, 'break_generation', 0) + 1
+
     def update_camera_display(analysis):
         # If camera not present or analysis None
         if analysis is None:
@@ -392,7 +422,8 @@ def start_eye_break_main(app, reset=False):
             app.break_ui['angle_label'].configure(text="Head position: --° vertical | --° horizontal")
             return
 
-        frame = analysis['frame']
+        # color is decoded only here, for the frames actually shown
+        frame = color_frame(analysis)
         msg = analysis['message']
         color = (40, 180, 80) if analysis.get('peeking') else (40, 120, 200)
 
@@ -427,9 +458,27 @@ def start_eye_break_main(app, reset=False):
         if analysis['face_detected']:
             app.break_ui['angle_label'].configure(text=(f"Head position: {analysis['vert_angle']:.1f}° vertical | {analysis['horiz_angle']:.1f}° horizontal"))
 
-    # main tick + camera-check logic
+    # main tick: the look-away monitor samples the camera on its own thread
+    # and resets the break through events; ticks only read its state
     def tick():
         nonlocal countdown_seconds
+        if app.break_generation != generation:
+            return  # superseded by a reset
+
+        analysis = monitor.latest()
+        if analysis is not None:
+            session.update(camera_status=analysis.get('message'))
+            try:
+                update_camera_display(analysis)
+            except Exception as e:
+                print(f"[Camera Error] {e}")
+
+        # hold the countdown while the user is still looking at the screen
+        if monitor.state in (STATE_LOOKING, STATE_LOW_LIGHT):
+            set_counter_text("Please\nLook\nAway" if monitor.state == STATE_LOOKING else "Camera\nError")
+            app.after(1000, tick)
+            return
+
         # update UI
         update_progress_ui(countdown_seconds)
 
@@ -439,45 +488,13 @@ def start_eye_break_main(app, reset=False):
                     app.break_ui['nature_sound'].stop()
                 except Exception:
                     pass
+            monitor.stop()
+            app.break_ui['look_unsubscribe']()
             show_post_break_main(app)
             return
 
-        # camera check in thread
-        def camera_check():
-            try:
-                peeking, analysis = is_user_peeking()
-                # update camera display on main thread
-                app.after(0, lambda: update_camera_display(analysis))
-
-                # if camera produces black frame
-                if analysis.get('is_black'):
-                    app.after(0, lambda: app.break_ui['canvas'].itemconfig(app.break_ui['counter_text_id'], text="Camera\nError"))
-                    if app.break_ui['nature_sound']:
-                        try:
-                            app.break_ui['nature_sound'].stop()
-                        except Exception:
-                            pass
-                    start_eye_break_main(app, reset=True)
-                    return
-
-                # if user looks at screen -> reset the break (ask to look away)
-                if peeking and analysis.get('message') == "Looking at screen":
-                    app.after(0, lambda: app.break_ui['canvas'].itemconfig(app.break_ui['counter_text_id'], text="Please\nLook\nAway"))
-                    if app.break_ui['nature_sound']:
-                        try:
-                            app.break_ui['nature_sound'].stop()
-                        except Exception:
-                            pass
-                    start_eye_break_main(app, reset=True)
-                else:
-                    # continue countdown after 1 second
-                    app.after(1000, tick)
-            except Exception as e:
-                print(f"[Camera Error] {e}")
-                app.after(1000, tick)
-
-        threading.Thread(target=camera_check, daemon=True).start()
         countdown_seconds -= 1
+        app.after(1000, tick)
 
     # start ticking
     tick()
@@ -486,6 +503,7 @@ def start_eye_break_main(app, reset=False):
 # Post-break / completion screen
 # -------------------------
 def show_post_break_main(app):
+    session.update(phase=PHASE_POST_BREAK)
     fonts = scaled_fonts(app)
     main_frame = app.main_frame
     for w in main_frame.winfo_children():
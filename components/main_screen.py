@@ -1,10 +1,13 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog
-from PIL import Image, ImageTk
 import os
-from config.paths import ICON_FILE
+from config.paths import ICON_FILE, EYE_ICON_FILE, DEFAULT_ALARM, USER_SOUNDS_DIR
 from config.settings import load_settings, save_settings
+from utils.assets import get_asset_cache
+from utils.sound_library import get_sound_library
+from utils.ui_dispatch import post_to_ui
+from components.virtual_list import VirtualRadioList
 
 
 def load_main_screen(app):
@@ -44,8 +47,8 @@ def load_main_screen(app):
 
     # === Icon and Title ===
     try:
-        img = Image.open(ICON_FILE).resize((110, 110))
-        icon_img = ctk.CTkImage(img, size=(110, 110))
+        # decoded once per process and shared across screen rebuilds
+        icon_img = get_asset_cache().ctk_image(ICON_FILE, (110, 110))
         ctk.CTkLabel(card, image=icon_img, text="").pack(pady=(15, 5))
     except Exception as e:
         print("Icon load error:", e)
@@ -107,9 +110,12 @@ def load_main_screen(app):
     )
     reset_btn.pack(side="left", padx=12)
 
-    # === Customize Button ===
+    # === Customize / Stats Buttons ===
+    tools_frame = ctk.CTkFrame(card, fg_color="transparent")
+    tools_frame.pack(pady=(10, 15))
+
     customize_btn = ctk.CTkButton(
-        card,
+        tools_frame,
         text="⛭️Customize",
         font=("Poppins", 16),
         height=45,
@@ -118,17 +124,28 @@ def load_main_screen(app):
         hover_color="#2C689A",
         command=lambda: open_customize_window(app)
     )
-    customize_btn.pack(pady=(10, 15))
+    customize_btn.pack(side="left", padx=8)
+
+    def open_stats():
+        from components.stats_screen import open_stats_window
+        open_stats_window(app)
+
+    stats_btn = ctk.CTkButton(
+        tools_frame,
+        text="📊 Stats",
+        font=("Poppins", 16),
+        height=45,
+        corner_radius=12,
+        fg_color="#3A84C3",
+        hover_color="#2C689A",
+        command=open_stats
+    )
+    stats_btn.pack(side="left", padx=8)
 
     # === Footer (with eye.png image) ===
     try:
-        # Construct image path relative to current file (components folder)
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        eye_icon_path = os.path.join(base_dir, "..", "assets", "eye.png")
-
-        # Load image
-        eye_img = Image.open(eye_icon_path).resize((18, 18))
-        eye_icon = ImageTk.PhotoImage(eye_img)
+        # Load image (shared PhotoImage from the asset cache)
+        eye_icon = get_asset_cache().photo_image(EYE_ICON_FILE, (18, 18))
 
         # Frame for footer
         footer_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -164,6 +181,7 @@ def load_main_screen(app):
     app.countdown_label = countdown_label
     app.start_btn = start_btn
     app.customize_btn = customize_btn
+    app.stats_btn = stats_btn
     app.timer.countdown_label = countdown_label
     app.timer.start_btn = start_btn
     app.timer.customize_btn = customize_btn
@@ -174,6 +192,10 @@ def load_main_screen(app):
 
 def open_customize_window(app):
     """Modern settings UI with neumorphic panels."""
+    # NumPy-backed helpers, imported here rather than at startup
+    from utils.sound_import import import_sound
+    from utils.tones import TONE_PRESETS, is_tone, tone_label
+
     main_frame = app.main_frame
     for w in main_frame.winfo_children():
         w.destroy()
@@ -199,13 +221,22 @@ def open_customize_window(app):
         file = filedialog.askopenfilename(filetypes=[("WAV Files", "*.wav")])
         if not file:
             return
-        os.makedirs("sounds/user", exist_ok=True)
-        dest = os.path.join("sounds/user", os.path.basename(file))
-        with open(file, "rb") as src, open(dest, "wb") as dst:
-            dst.write(src.read())
-        if os.path.basename(file) not in app.settings["user_sounds"]:
-            app.settings["user_sounds"].append(os.path.basename(file))
+        upload_status.configure(text=f"Importing {os.path.basename(file)}...")
+        # copy + convert to the mixer's format off the UI thread
+        import_sound(file, on_done=lambda name, error: post_to_ui(finish_upload, name, error))
+
+    def finish_upload(name, error):
+        try:
+            if error:
+                upload_status.configure(text=f"Import failed: {error}")
+                return
+            upload_status.configure(text="")
+        except Exception:
+            return
+        if name not in app.settings["user_sounds"]:
+            app.settings["user_sounds"].append(name)
         save_settings(app.settings)
+        library.scan()
         refresh_sound_options()
 
     ctk.CTkButton(
@@ -218,26 +249,41 @@ def open_customize_window(app):
         corner_radius=10
     ).pack(pady=10)
 
+    upload_status = ctk.CTkLabel(card, text="", font=fonts["text"], text_color="#6A7B89")
+    upload_status.pack()
+
     # Sound Options
     ctk.CTkLabel(card, text="Select Alarm Sound:", font=fonts["section"], text_color="#3A506B").pack(pady=(20, 5))
     sound_var = tk.StringVar(value=app.settings.get("selected_alarm", "default_alarm.wav"))
-    sound_frame = ctk.CTkFrame(card, fg_color="#F4F6F8", corner_radius=10)
-    sound_frame.pack(pady=5, padx=20, fill="x")
+    # no textvariable: CTkEntry hides its placeholder when one is set
+    search_entry = ctk.CTkEntry(card, placeholder_text="Search sounds...", font=fonts["text"], height=30)
+    search_entry.pack(padx=20, fill="x")
+
+    # header-only metadata from the library index; nothing is decoded here
+    library = get_sound_library()
+    library.scan()
+
+    def sound_label(name):
+        if is_tone(name):
+            return f"{tone_label(name)}  (built-in tone)"
+        path = DEFAULT_ALARM if name == "default_alarm.wav" else os.path.join(USER_SOUNDS_DIR, name)
+        entry = library.cached(path)
+        if entry and entry.get("duration"):
+            return f"{name}  ({entry['duration']:.0f}s)"
+        return name
+
+    # only the visible rows exist as widgets, however many sounds are imported
+    sound_list = VirtualRadioList(card, sound_var, label=sound_label,
+                                  search_text=lambda name: tone_label(name) if is_tone(name) else name,
+                                  rows=4, font=fonts["text"])
+    sound_list.pack(pady=5, padx=20, fill="x")
+    search_entry.bind("<KeyRelease>", lambda e: sound_list.search(search_entry.get()))
+    # loudness analysis runs once at a time in the background; relabel when it's done
+    library.analyze_pending_async(on_done=lambda: post_to_ui(sound_list.refresh_labels))
 
     def refresh_sound_options():
-        for child in sound_frame.winfo_children():
-            child.destroy()
-        opts = ["default_alarm.wav"] + app.settings.get("user_sounds", [])
-        for o in opts:
-            ctk.CTkRadioButton(
-                sound_frame,
-                text=o,
-                variable=sound_var,
-                value=o,
-                font=fonts["text"],
-                fg_color="#1D4E89",
-                hover_color="#163B66"
-            ).pack(anchor="w", padx=20, pady=6)
+        sound_list.set_items(["default_alarm.wav"] + list(TONE_PRESETS) + app.settings.get("user_sounds", []))
+        sound_list.show(sound_var.get())
     refresh_sound_options()
 
     # Nature Sound Toggle
@@ -263,6 +309,9 @@ def open_customize_window(app):
     ctk.CTkRadioButton(
         option_box, text="Continuous Loop", variable=loop_style, value=2, font=fonts["text"], fg_color="#1D4E89"
     ).pack(anchor="w", padx=20, pady=8)
+    ctk.CTkRadioButton(
+        option_box, text="Escalating Volume", variable=loop_style, value=3, font=fonts["text"], fg_color="#1D4E89"
+    ).pack(anchor="w", padx=20, pady=8)
 
     # Save Button
     def save_and_back():
@@ -0,0 +1,122 @@
+import customtkinter as ctk
+import numpy as np
+
+CHART_WEEKS = 12
+CHART_WIDTH = 400
+CHART_HEIGHT = 130
+
+
+def _percent(value):
+    return "–" if value is None else f"{value * 100:.0f}%"
+
+
+def _seconds(value):
+    return "–" if value is None else f"{value:.1f}s"
+
+
+def open_stats_window(app):
+    """Break compliance statistics, read from the event log's rollup tables."""
+    from components.main_screen import load_main_screen
+    from utils.stats import overview
+
+    main_frame = app.main_frame
+    for w in main_frame.winfo_children():
+        w.destroy()
+
+    fonts = {
+        "title": ctk.CTkFont("Segoe UI Semibold", 26),
+        "section": ctk.CTkFont("Poppins SemiBold", 16),
+        "text": ctk.CTkFont("Segoe UI", 14),
+        "small": ctk.CTkFont("Segoe UI", 11),
+        "button": ctk.CTkFont("Poppins Medium", 16)
+    }
+
+    card = ctk.CTkFrame(main_frame, fg_color="white", corner_radius=20)
+    card.place(relx=0.5, rely=0.5, anchor="center")
+    card.configure(width=460, height=600)
+    card.pack_propagate(False)
+
+    ctk.CTkLabel(
+        card, text="📊 Break Statistics", font=fonts["title"], text_color="#1D4E89"
+    ).pack(pady=(15, 10))
+
+    try:
+        stats = overview()
+    except Exception as e:
+        print("Stats load error:", e)
+        stats = None
+
+    if stats is None or not stats["periods"]["All time"]["alarms"]:
+        ctk.CTkLabel(
+            card, text="No breaks recorded yet.\nStart the timer and take a break!",
+            font=fonts["text"], text_color="#6A7B89"
+        ).pack(pady=40)
+    else:
+        # === Summary table ===
+        table = ctk.CTkFrame(card, fg_color="#F4F6F8", corner_radius=10)
+        table.pack(padx=20, fill="x")
+        headers = ["", "Completed", "Compliance", "Look-away", "Resets"]
+        for col, header in enumerate(headers):
+            ctk.CTkLabel(table, text=header, font=fonts["small"], text_color="#6A7B89").grid(
+                row=0, column=col, padx=6, pady=(6, 2), sticky="w")
+        for row, (name, totals) in enumerate(stats["periods"].items(), start=1):
+            values = [
+                name,
+                f"{totals['completed']:.0f}/{totals['alarms']:.0f}",
+                _percent(totals["compliance"]),
+                _seconds(totals["mean_latency"]),
+                "–" if totals["resets_per_break"] is None else f"{totals['resets_per_break']:.1f}",
+            ]
+            for col, value in enumerate(values):
+                ctk.CTkLabel(table, text=value, font=fonts["text"], text_color="#3A506B").grid(
+                    row=row, column=col, padx=6, pady=2, sticky="w")
+
+        ctk.CTkLabel(
+            card, text="Look-away: mean time from alarm to Start Break. Resets: per break.",
+            font=fonts["small"], text_color="#6A7B89"
+        ).pack(pady=(4, 0))
+
+        # === Weekly compliance chart ===
+        ctk.CTkLabel(card, text="Weekly Compliance:", font=fonts["section"], text_color="#3A506B").pack(pady=(16, 5))
+        canvas = ctk.CTkCanvas(card, width=CHART_WIDTH, height=CHART_HEIGHT, bg="#F4F6F8", highlightthickness=0)
+        canvas.pack()
+        draw_weekly_chart(canvas, stats["weekly"], fonts["small"])
+
+        # === Best hour ===
+        profile = stats["hour_profile"]
+        if not np.all(np.isnan(profile)):
+            best = int(np.nanargmax(profile))
+            ctk.CTkLabel(
+                card, text=f"You take breaks most reliably around {best:02d}:00 ({_percent(profile[best])}).",
+                font=fonts["text"], text_color="#6A7B89"
+            ).pack(pady=(12, 0))
+
+    ctk.CTkButton(
+        card,
+        text="← Back",
+        command=lambda: load_main_screen(app),
+        font=fonts["button"],
+        fg_color="#1D4E89",
+        hover_color="#163B66",
+        corner_radius=10,
+        height=45
+    ).pack(side="bottom", pady=(10, 20))
+
+
+def draw_weekly_chart(canvas, weekly, font):
+    """Bar per week (last CHART_WEEKS weeks) of completed / alarms."""
+    weeks = weekly["week"][-CHART_WEEKS:]
+    compliance = weekly["compliance"][-CHART_WEEKS:]
+    if not len(weeks):
+        return
+    slot = CHART_WIDTH / CHART_WEEKS
+    base = CHART_HEIGHT - 20
+    for i, (week, value) in enumerate(zip(weeks, compliance)):
+        x = i * slot + slot * 0.2
+        if not np.isnan(value):
+            top = base - value * (base - 10)
+            color = "#7BA05B" if value >= 0.8 else "#E0A030" if value >= 0.5 else "#E05353"
+            canvas.create_rectangle(x, top, x + slot * 0.6, base, fill=color, outline="")
+        label = str(week)[5:].replace("-", "/")
+        canvas.create_text(x + slot * 0.3, base + 10, text=label, font=font, fill="#6A7B89")
+    canvas.create_line(0, base, CHART_WIDTH, base, fill="#D1DCE9")
@@ -1,4 +1,6 @@
-import threading
+import math
+import time
+from config.session import session, PHASE_IDLE, PHASE_WORKING
 
 class Timer:
     def __init__(self, app, countdown_label, start_btn, customize_btn):
@@ -8,38 +10,83 @@ class Timer:
         self.customize_btn = customize_btn
         self.timer_running = False
         self.total_seconds = 0
-        self.timer_thread = None
+        # wall-clock end of the work period; checkpointed via session "timer_deadline"
+        self.deadline = None
+        self._tick_id = None
 
-    def start_20min_timer(self):
+    def start_20min_timer(self, remaining=None):
         self.start_btn.configure(state="disabled")
         self.customize_btn.configure(state="disabled")
-        self.total_seconds = 2 * 60  # 20 minutes in seconds
+        self._set_stats_state("disabled")
+        self.total_seconds = 2 * 60 if remaining is None else int(math.ceil(remaining))  # 20 minutes in seconds
+        self.deadline = time.time() + (self.total_seconds if remaining is None else remaining)
         self.timer_running = True
-        self.timer_thread = threading.Thread(target=self.timer_countdown, daemon=True)
-        self.timer_thread.start()
+        session.update(phase=PHASE_WORKING, timer_deadline=self.deadline)
+        # ticks are after() callbacks on the Tk thread; no worker thread needed
+        self.timer_countdown()
 
     def reset_timer(self):
         self.timer_running = False
+        self._cancel_tick()
+        self.deadline = None
+        session.update(phase=PHASE_IDLE, timer_deadline=None)
         self.total_seconds = 20 * 60
         self.countdown_label.configure(text="20:00")
         self.start_btn.configure(state="normal")
         self.customize_btn.configure(state="normal")
+        self._set_stats_state("normal")
+
+    def _set_stats_state(self, state):
+        stats_btn = getattr(self.app, "stats_btn", None)
+        if stats_btn:
+            stats_btn.configure(state=state)
+
+    def _cancel_tick(self):
+        if self._tick_id is not None:
+            try:
+                self.app.after_cancel(self._tick_id)
+            except Exception:
+                pass
+            self._tick_id = None
 
     def timer_countdown(self):
         def update():
+            self._tick_id = None
             if not self.timer_running:
                 return
-                
+
+            # derived from the deadline, so late ticks and suspends don't drift
+            remaining = max(0.0, self.deadline - time.time())
+            self.total_seconds = int(math.ceil(remaining))
             mins, secs = divmod(self.total_seconds, 60)
             self.countdown_label.configure(text=f"{mins:02d}:{secs:02d}")
             self.app.apply_topmost_behavior()
 
             if self.total_seconds > 0:
-                self.total_seconds -= 1
-                self.app.after(1000, update)
+                # wake just after the display next changes
+                delay = remaining - (self.total_seconds - 1)
+                self._tick_id = self.app.after(max(1, int(delay * 1000) + 5), update)
             else:
                 self.timer_running = False
                 from components.alarm import show_alarm_overlay
                 show_alarm_overlay(self.app)
 
-        self.app.after(0, update)
\ No newline at end of file
+        self._cancel_tick()
+        self._tick_id = self.app.after(0, update)
+
+
+def restore_timer(app):
+    """
+    Bring back a timer interrupted by a crash or restart: resume the work
+    countdown with the time actually left, or show the alarm if it ran out
+    while the app was closed (see utils.checkpoint.resume_action()).
+    """
+    from utils.checkpoint import get_timer_checkpoint, resume_action
+    action, remaining = resume_action(get_timer_checkpoint().load())
+    if action == "resume":
+        print(f"Resuming timer with {int(remaining)}s left")
+        app.timer.start_20min_timer(remaining)
+    elif action == "alarm":
+        print("Timer expired while closed; showing alarm")
+        from components.alarm import show_alarm_overlay
+        show_alarm_overlay(app)
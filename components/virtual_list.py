@@ -0,0 +1,132 @@
+import customtkinter as ctk
+
+ROW_HEIGHT = 34
+VISIBLE_ROWS = 5
+
+
+class VirtualRadioList(ctk.CTkFrame):
+    """
+    Scrolling list of radio buttons that stays cheap at any length.
+
+    Only VISIBLE_ROWS radio buttons are ever created. Scrolling moves an
+    offset into the (filtered) item list and reconfigures those same
+    widgets with the new text and value, so hundreds of sounds cost the
+    same as five. Labels are computed on first display and cached until
+    refresh_labels().
+
+    search() filters over an in-memory index of lowercased names built once
+    in set_items(); when the query extends the previous one only the
+    previous matches are rescanned, so typing stays instant.
+    """
+    def __init__(self, master, variable, label=None, search_text=None,
+                 rows=VISIBLE_ROWS, row_height=ROW_HEIGHT, font=None,
+                 fg_color="#F4F6F8", radio_color="#1D4E89", hover_color="#163B66", **kwargs):
+        super().__init__(master, fg_color=fg_color, corner_radius=10,
+                         height=rows * row_height, **kwargs)
+        self.pack_propagate(False)
+        self.variable = variable
+        self.label = label or str
+        self.search_text = search_text or self.label
+        self.row_height = row_height
+        self.items = []
+        self.index = []
+        self.matches = []
+        self.query = ""
+        self.offset = 0
+        self._labels = {}
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=4)
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+
+        self.empty_label = ctk.CTkLabel(self.body, text="No matching sounds", font=font,
+                                        text_color="#6A7B89")
+        self.rows = []
+        for i in range(rows):
+            row = ctk.CTkRadioButton(self.body, text="", variable=variable, value="",
+                                     font=font, fg_color=radio_color, hover_color=hover_color)
+            row.place(x=20, y=i * row_height + 4)
+            self.rows.append(row)
+
+        for widget in [self, self.body] + self.rows:
+            widget.bind("<MouseWheel>", self._on_wheel, add="+")
+            widget.bind("<Button-4>", self._on_wheel, add="+")
+            widget.bind("<Button-5>", self._on_wheel, add="+")
+
+    # --- data ---
+    def set_items(self, items):
+        """Replace the item values; keeps the current search and scroll position."""
+        self.items = list(items)
+        self.index = [self.search_text(item).lower() for item in self.items]
+        self._labels = {}
+        query, self.query = self.query, None
+        self.search(query)
+
+    def search(self, query):
+        query = (query or "").strip().lower()
+        if query == self.query:
+            return
+        if self.query and query.startswith(self.query):
+            candidates = self.matches
+        else:
+            candidates = range(len(self.items))
+        self.matches = [i for i in candidates if query in self.index[i]] if query else list(candidates)
+        self.query = query
+        self.scroll_to(0)
+
+    def refresh_labels(self):
+        """Recompute the labels, e.g. after the metadata behind them changed."""
+        if not self.winfo_exists():
+            return
+        self._labels = {}
+        self._render()
+
+    # --- scrolling ---
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.matches) - len(self.rows)))
+        self._render()
+
+    def show(self, value):
+        """Scroll so value's row is visible, if it matches the current search."""
+        for position, i in enumerate(self.matches):
+            if self.items[i] == value:
+                if not self.offset <= position < self.offset + len(self.rows):
+                    self.scroll_to(position - len(self.rows) // 2)
+                return
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(int(round(float(args[0]) * len(self.matches))))
+        elif action == "scroll":
+            step = int(args[0]) * (len(self.rows) if args[1] == "pages" else 1)
+            self.scroll_to(self.offset + step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + step)
+        return "break"
+
+    def _render(self):
+        for slot, row in enumerate(self.rows):
+            position = self.offset + slot
+            if position < len(self.matches):
+                item = self.items[self.matches[position]]
+                if item not in self._labels:
+                    self._labels[item] = self.label(item)
+                row.configure(text=self._labels[item], value=item)
+                row.place(x=20, y=slot * self.row_height + 4)
+            else:
+                row.place_forget()
+        if self.matches:
+            self.empty_label.place_forget()
+        else:
+            self.empty_label.place(x=20, y=4)
+        total = max(1, len(self.matches))
+        self.scrollbar.set(self.offset / total,
+                           min(1.0, (self.offset + len(self.rows)) / total))
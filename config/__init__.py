@@ -1,5 +1,8 @@
 from .paths import *
 from .settings import *
 
-__all__ = ['resource_path', 'SETTINGS_PATH', 'DEFAULT_ALARM', 'ICON_FILE', 'NATURE_FILES',
+__all__ = ['resource_path', 'data_path', 'SETTINGS_PATH', 'DEFAULT_ALARM', 'ICON_FILE', 'NATURE_FILES',
+           'SOUNDS_DIR', 'USER_SOUNDS_DIR', 'SOUND_LIBRARY_PATH',
+           'EYE_ICON_FILE', 'THUMBNAIL_DIR', 'EVENT_LOG_PATH',
+           'DIAGNOSTICS_DIR', 'TIMER_STATE_PATH',
            'load_settings', 'save_settings']
\ No newline at end of file
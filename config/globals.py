@@ -1,4 +0,0 @@
-# config/globals.py
-nature_index = 0
-alarm_active = False
-alarm_start_time = None
\ No newline at end of file
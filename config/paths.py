@@ -11,10 +11,43 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+APP_NAME = "32O"
+
+def user_data_dir():
+    """ Writable per-user folder for state that must outlive the process """
+    if not hasattr(sys, "_MEIPASS"):
+        # dev: keep everything next to the sources, as before
+        return os.path.abspath(".")
+    if sys.platform.startswith("win"):
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_NAME)
+
+def data_path(relative_path):
+    """ Path to persistent app data; resource_path() points into PyInstaller's
+    per-run temp folder, which is deleted on exit """
+    base_path = user_data_dir()
+    try:
+        os.makedirs(base_path, exist_ok=True)
+    except OSError:
+        pass
+    return os.path.join(base_path, relative_path)
+
 # Path constants
 SETTINGS_PATH = resource_path("settings.json")
 DEFAULT_ALARM = resource_path("sounds/default_alarm.wav")
 ICON_FILE = resource_path("assets/icon2.ico")
+SOUNDS_DIR = resource_path("sounds")
+USER_SOUNDS_DIR = data_path("sounds/user")
+SOUND_LIBRARY_PATH = data_path("sound_library.json")
+EYE_ICON_FILE = resource_path("assets/eye.png")
+THUMBNAIL_DIR = data_path("cache/thumbnails")
+EVENT_LOG_PATH = data_path("events.db")
+DIAGNOSTICS_DIR = data_path("diagnostics")
+TIMER_STATE_PATH = data_path("timer_state.json")
 NATURE_FILES = [
     resource_path("nature/forest.wav"),
     resource_path("nature/rain.wav"), 
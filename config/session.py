@@ -0,0 +1,95 @@
+# config/session.py
+import threading
+
+# Session phases
+PHASE_IDLE = "idle"              # main screen, timer not running
+PHASE_WORKING = "working"        # 20 minute countdown running
+PHASE_ALARM = "alarm"            # alarm overlay showing
+PHASE_BREAK = "break"            # look-away countdown
+PHASE_POST_BREAK = "post_break"  # "Break Complete!" screen
+
+
+class SessionState:
+    """
+    Runtime state shared by the UI, the alarm and the camera worker.
+
+    Replaces the old config.globals module variables, which every importer
+    copied by value. Updates are lock-protected; subscribers are called
+    after the lock is released, on the thread that made the change, with
+    (key, old, new). UI subscribers must hop to the Tk thread via
+    utils.ui_dispatch.post_to_ui().
+    """
+    def __init__(self, **initial):
+        self._values = dict(initial)
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._subscribers = {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._values.get(key, default)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def update(self, **changes):
+        with self._lock:
+            callbacks = self._apply(changes)
+        self._notify(callbacks)
+
+    def increment(self, key, step=1):
+        with self._lock:
+            value = self._values.get(key, 0) + step
+            callbacks = self._apply({key: value})
+        self._notify(callbacks)
+        return value
+
+    def _apply(self, changes):
+        changed = []
+        for key, value in changes.items():
+            old = self._values.get(key)
+            if old != value:
+                self._values[key] = value
+                changed.append((key, old, value))
+        if changed:
+            self._changed.notify_all()
+        return [(callback, change) for change in changed
+                for callback in self._subscribers.get(change[0], []) + self._subscribers.get("*", [])]
+
+    def _notify(self, callbacks):
+        for callback, (key, old, new) in callbacks:
+            try:
+                callback(key, old, new)
+            except Exception as e:
+                print(f"Session subscriber error ({key}): {e}")
+
+    def subscribe(self, key, callback):
+        """Call callback(key, old, new) when key changes ("*" for any key). Returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                try:
+                    self._subscribers.get(key, []).remove(callback)
+                except ValueError:
+                    pass
+        return unsubscribe
+
+    def wait_for(self, key, predicate, timeout=None):
+        """Block until predicate(value) holds for key; returns whether it did."""
+        with self._lock:
+            return self._changed.wait_for(lambda: predicate(self._values.get(key)), timeout)
+
+
+# Global session instance
+session = SessionState(
+    phase=PHASE_IDLE,
+    alarm_active=False,
+    alarm_start_time=None,
+    nature_index=0,
+    break_resets=0,
+    camera_status=None,
+    timer_deadline=None,
+)
@@ -1,22 +1,141 @@
+import atexit
+import copy
 import json
 import os
+import tempfile
+import threading
+import time
 from config.paths import SETTINGS_PATH
+from utils.helpers import chmod_default
+
+DEFAULT_SETTINGS = {
+    "selected_alarm": "default_alarm.wav",
+    "user_sounds": [],
+    "nature_sound": True,
+    "alarm_loop_style": 1
+}
+SAVE_DEBOUNCE_SECONDS = 0.5
+RELOAD_CHECK_SECONDS = 2.0
+
+
+class SettingsStore:
+    """
+    settings.json held in memory.
+
+    The file is parsed once; every load_settings() call hands out the same
+    dict. Writes are debounced and done as temp-file-plus-rename, so a crash
+    never leaves a half-written file, and a background watcher picks up
+    external edits by mtime and applies them to that same dict in place.
+    """
+    def __init__(self, path=SETTINGS_PATH):
+        self.path = path
+        self.data = None
+        self._mtime = None
+        # mtime of a settings.json that failed to parse, reported once
+        self._failed_mtime = None
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._watcher = None
+
+    def load(self):
+        with self._lock:
+            if self.data is None:
+                self.data = {}
+                self._read(initial=True)
+                self._start_watcher()
+            return self.data
+
+    def _read(self, initial=False):
+        if not os.path.exists(self.path):
+            self._replace(copy.deepcopy(DEFAULT_SETTINGS))
+            self._write()
+            return
+        mtime = None
+        try:
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, "r") as f:
+                loaded = json.load(f)
+        except Exception as e:
+            print("Settings load error:", e)
+            self._failed_mtime = mtime
+            if not initial:
+                # likely a half-written external edit: keep what we have,
+                # and try again once the file changes
+                return
+            loaded, mtime = copy.deepcopy(DEFAULT_SETTINGS), None
+        self._replace(loaded)
+        self._mtime = mtime
+
+    def _replace(self, loaded):
+        # everyone holds this same dict, so it is updated in place, but
+        # never cleared: readers on other threads see old or new values,
+        # not a momentarily empty dict
+        with self._lock:
+            self.data.update(loaded)
+            for key in [key for key in self.data if key not in loaded]:
+                del self.data[key]
+
+    def save(self, settings=None):
+        """Schedule a write; bursts of saves within the debounce window become one."""
+        with self._lock:
+            data = self.load()
+            if settings is not None and settings is not data:
+                self._replace(settings)
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes now."""
+        with self._lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            self._write()
+
+    def _write(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            chmod_default(tmp_path)
+            os.replace(tmp_path, self.path)
+            self._mtime = os.path.getmtime(self.path)
+        except Exception as e:
+            print("Settings save error:", e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _start_watcher(self):
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(RELOAD_CHECK_SECONDS)
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                continue
+            with self._lock:
+                # our own pending write wins over an external edit
+                if (mtime != self._mtime and mtime != self._failed_mtime
+                        and self._save_timer is None):
+                    self._read()
+
+
+# Global store instance
+settings_store = SettingsStore()
+atexit.register(settings_store.flush)
 
 def load_settings():
-    if not os.path.exists(SETTINGS_PATH):
-        default_settings = {
-            "selected_alarm": "default_alarm.wav",
-            "user_sounds": [],
-            "nature_sound": True,
-            "alarm_loop_style": 1
-        }
-        with open(SETTINGS_PATH, "w") as f:
-            json.dump(default_settings, f)
-        return default_settings
-    
-    with open(SETTINGS_PATH, "r") as f:
-        return json.load(f)
+    return settings_store.load()
 
 def save_settings(settings):
-    with open(SETTINGS_PATH, "w") as f:
-        json.dump(settings, f, indent=2)
\ No newline at end of file
+    settings_store.save(settings)
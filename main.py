@@ -1,11 +1,30 @@
 import customtkinter as ctk
-import pygame
 import os
 import sys
+import threading
+import time
 from config.paths import ICON_FILE
 from config.settings import load_settings
 from components.main_screen import load_main_screen
-from components.timer import Timer
+from components.timer import Timer, restore_timer
+from utils.audio_service import get_audio_service
+from utils.event_log import start_break_recorder
+from utils.checkpoint import start_timer_checkpoint
+from utils.diagnostics import get_diagnostics
+from utils.ui_dispatch import install_ui_dispatcher
+
+# Imported in the background once the window is up, so the alarm overlay and
+# break screen open instantly later without slowing down the first paint
+PRELOAD_MODULES = [
+    "numpy",
+    "cv2",
+    "PIL.Image",
+    "utils.camera",
+    "utils.ambient",
+    "utils.tones",
+    "components.alarm",
+    "components.break_screen",
+]
 
 class EyeCareApp(ctk.CTk):
     """
@@ -42,17 +61,17 @@ class EyeCareApp(ctk.CTk):
 
         # Make sure ESC still closes the app for convenience
         self.bind("<Escape>", lambda e: self.destroy())
+        # Ctrl+Shift+F saves the camera frame recorder's buffer, if it's enabled
+        self.bind_all("<Control-Shift-F>", lambda e: self._dump_frames(), add="+")
 
         # Enhanced eye-friendly colors & settings
         self.configure(bg="#F0F4F8")  # Soft blue-gray background
         self.force_topmost = False
         self.settings = load_settings()
-
-        # Initialize pygame mixer (safe-guarded)
-        try:
-            pygame.mixer.init()
-        except Exception:
-            pass
+        start_break_recorder()
+        start_timer_checkpoint()
+        # background threads hand their UI work to this instead of calling Tk
+        install_ui_dispatcher(self)
 
         # Custom titlebar (simple, contains app title and close button)
         # keep it visually consistent with the app
@@ -130,6 +149,13 @@ class EyeCareApp(ctk.CTk):
         # Apply consistent styling after short delay (allows widgets to be created)
         self.after(100, self._apply_eye_friendly_styles)
 
+        # Bring up audio in the background once the window has painted;
+        # it only has to be ready by the first alarm
+        self.after(250, self._start_audio)
+        self.after(1500, self._preload_modules)
+        # pick up a timer that was running when the app last exited
+        self.after(500, lambda: restore_timer(self))
+
         # Optional: ensure the app is raised and focused (if force_topmost used elsewhere)
         if getattr(self, "force_topmost", False):
             try:
@@ -138,6 +164,37 @@ class EyeCareApp(ctk.CTk):
             except Exception:
                 pass
 
+    def _start_audio(self):
+        audio = get_audio_service()
+        audio.on_ready(self._warm_audio)
+        audio.start()
+
+    def _preload_modules(self):
+        def _run():
+            import importlib
+            for name in PRELOAD_MODULES:
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    print(f"Preload error ({name}): {e}")
+        threading.Thread(target=_run, daemon=True).start()
+
+    def _warm_audio(self):
+        """Decode the selected alarm ahead of time (runs on the audio thread)."""
+        if not get_audio_service().is_ready():
+            return
+        try:
+            from components.alarm import resolve_alarm_path, load_alarm_sound
+            load_alarm_sound(resolve_alarm_path(self.settings))
+        except Exception as e:
+            print("Audio warm-up error:", e)
+
+    def _dump_frames(self):
+        # only if the camera is already loaded; this shouldn't start it
+        camera = sys.modules.get("utils.camera")
+        if camera is not None:
+            camera.dump_frame_recorder()
+
     def _apply_eye_friendly_styles(self):
         """Apply optimized eye protection styles to all elements"""
         # Configure buttons with protective colors
@@ -212,5 +269,17 @@ class EyeCareApp(ctk.CTk):
                 pass
 
 if __name__ == "__main__":
+    # opt-in profiling/leak tracking (EYECARE_DIAGNOSTICS=1); a no-op otherwise
+    diagnostics = get_diagnostics()
+    diagnostics.start()
     app = EyeCareApp()
-    app.mainloop()
+    bench_file = os.environ.get("EYECARE_STARTUP_BENCH")
+    if bench_file:
+        # benchmarks/startup.py: record when the first frame is on screen, then quit
+        app.update()
+        with open(bench_file, "w") as f:
+            f.write(repr(time.time()))
+        app.destroy()
+    else:
+        diagnostics.run_mainloop(app)
+
@@ -1,4 +1,17 @@
-from .helpers import *
-from .camera import *
+# Submodules are imported on first use so that importing any utils module
+# doesn't load OpenCV through utils.camera.
+import importlib
 
-__all__ = ['interpolate_color', 'hex_to_rgb', 'is_user_peeking']
\ No newline at end of file
+_EXPORTS = {
+    'interpolate_color': 'helpers',
+    'hex_to_rgb': 'helpers',
+    'is_user_peeking': 'camera',
+}
+
+__all__ = ['interpolate_color', 'hex_to_rgb', 'is_user_peeking']
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,194 @@
+import os
+import time
+import threading
+import numpy as np
+from config.paths import NATURE_FILES
+from config.session import session
+from utils.audio_service import get_audio_service
+from utils.pcm import WavReader, FormatConverter, float_to_mixer, mixer_format
+from utils.sound_library import get_sound_library
+
+AMBIENT_CHANNEL = 0          # reserved mixer channel for ambience
+CHUNK_SECONDS = 0.5
+CROSSFADE_SECONDS = 4.0
+FADE_IN_SECONDS = 1.0
+FADE_OUT_MS = 800
+
+
+class _Track:
+    """One WAV file being streamed and converted to the mixer's layout."""
+    def __init__(self, path, rate, channels, start_frame=0):
+        self.path = path
+        self.reader = WavReader(path)
+        self.reader.setpos(start_frame)
+        self.ratio = rate / self.reader.framerate
+        self.channels = channels
+        self.converter = FormatConverter(self.reader.framerate, self.reader.channels, rate, channels)
+        try:
+            self.gain = get_sound_library().gain(path)
+        except Exception:
+            self.gain = 1.0
+        self._pending = np.zeros((0, channels), dtype=np.float32)
+
+    def remaining(self):
+        """Output frames left in this track (approximate when resampling)."""
+        return int((self.reader.nframes - self.reader.tell()) * self.ratio) + len(self._pending)
+
+    def read(self, n):
+        """Return exactly n output frames, zero-padded at end of file."""
+        while len(self._pending) < n and self.reader.tell() < self.reader.nframes:
+            src_frames = max(1, int(np.ceil((n - len(self._pending)) / self.ratio)) + 1)
+            converted = self.converter.process(self.reader.read_float(src_frames)) * self.gain
+            self._pending = np.concatenate([self._pending, converted])
+        out, self._pending = self._pending[:n], self._pending[n:]
+        if len(out) < n:
+            out = np.concatenate([out, np.zeros((n - len(out), self.channels), dtype=np.float32)])
+        return out
+
+    def position(self):
+        return self.reader.tell()
+
+    def close(self):
+        self.reader.close()
+
+
+class AmbientPlayer:
+    """
+    Streams long ambience WAVs in small chunks onto a reserved mixer channel.
+
+    Only two chunks are ever decoded at once, so memory stays constant no
+    matter how long the files are. Tracks rotate with an equal-power
+    crossfade, missing files are skipped via an index built once up front,
+    and stop() remembers the position so the next start() resumes there.
+    """
+    def __init__(self, files=NATURE_FILES, volume=0.55):
+        # availability index, so rotation never touches a missing file
+        self.tracks = [p for p in files if os.path.isfile(p)]
+        self.volume = volume
+        self._track_index = session.get("nature_index", 0)
+        self._resume_frame = 0
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def playing(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start (or keep) playing, resuming from the last stop position. Never blocks."""
+        with self._lock:
+            if not self.tracks:
+                return
+            previous = self._thread if self.playing else None
+            if previous is not None and not self._stop.is_set():
+                return
+            # each run gets its own stop flag, so a feeder still fading out
+            # stays stopped; the new one waits for it on its own thread
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop, previous), daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Fade out and stop; returns immediately, the feeder winds down itself."""
+        with self._lock:
+            self._stop.set()
+
+    def _open(self, index, start_frame=0):
+        path = self.tracks[index % len(self.tracks)]
+        return _Track(path, self._rate, self._channels, start_frame)
+
+    def _run(self, stop, previous=None):
+        try:
+            if previous is not None:
+                # finishes its fade-out and records the resume position
+                previous.join()
+            if not get_audio_service().wait_ready(10) or stop.is_set():
+                return
+            import pygame
+            self._rate, self._fmt, self._channels = mixer_format()
+            if pygame.mixer.get_num_channels() <= AMBIENT_CHANNEL:
+                pygame.mixer.set_num_channels(AMBIENT_CHANNEL + 1)
+            pygame.mixer.set_reserved(AMBIENT_CHANNEL + 1)
+            channel = pygame.mixer.Channel(AMBIENT_CHANNEL)
+            channel.set_volume(self.volume)
+
+            chunk = int(self._rate * CHUNK_SECONDS)
+            self._current = self._open(self._track_index, self._resume_frame)
+            self._next = None
+            self._fade_len = 0
+            self._fade_pos = 0
+            self._faded_in = 0
+
+            channel.play(self._make_sound(self._next_block(chunk)))
+            channel.queue(self._make_sound(self._next_block(chunk)))
+            stopping = False
+            while True:
+                if stopping:
+                    time.sleep(CHUNK_SECONDS / 4)
+                else:
+                    stopping = stop.wait(CHUNK_SECONDS / 4)
+                if channel.get_busy() and channel.get_queue() is not None:
+                    continue
+                if stopping:
+                    # end on a short rendered fade instead of cutting off
+                    n = int(self._rate * FADE_OUT_MS / 1000)
+                    block = self._next_block(n) * np.linspace(1.0, 0.0, n, dtype=np.float32)[:, None]
+                    self._queue(channel, self._make_sound(block))
+                    break
+                self._queue(channel, self._make_sound(self._next_block(chunk)))
+
+            # remember where to resume; mid-crossfade the incoming track wins
+            if self._next:
+                self._current.close()
+                self._current, self._next = self._next, None
+            self._resume_frame = self._current.position()
+            self._current.close()
+        except Exception as e:
+            print(f"Ambient playback error: {e}")
+
+    def _queue(self, channel, sound):
+        if channel.get_busy():
+            channel.queue(sound)
+        else:
+            channel.play(sound)
+
+    def _next_block(self, n):
+        current = self._current
+        if self._next is None and current.remaining() <= int(self._rate * CROSSFADE_SECONDS):
+            self._track_index += 1
+            session.update(nature_index=self._track_index)
+            self._next = self._open(self._track_index)
+            self._fade_len = max(1, current.remaining())
+            self._fade_pos = 0
+
+        block = current.read(n)
+        if self._next is not None:
+            incoming = self._next.read(n)
+            g = np.clip((self._fade_pos + np.arange(n)) / self._fade_len, 0.0, 1.0)[:, None]
+            block = block * np.cos(g * np.pi / 2) + incoming * np.sin(g * np.pi / 2)
+            self._fade_pos += n
+            if self._fade_pos >= self._fade_len:
+                current.close()
+                self._current, self._next = self._next, None
+
+        fade_in_frames = int(self._rate * FADE_IN_SECONDS)
+        if self._faded_in < fade_in_frames:
+            ramp = np.clip((self._faded_in + np.arange(n)) / fade_in_frames, 0.0, 1.0)[:, None]
+            block = block * ramp
+            self._faded_in += n
+        return block
+
+    def _make_sound(self, block):
+        import pygame
+        return pygame.mixer.Sound(buffer=float_to_mixer(block.astype(np.float32), self._fmt))
+
+
+# Global player instance
+ambient_player = None
+
+def get_ambient_player():
+    global ambient_player
+    if ambient_player is None:
+        ambient_player = AmbientPlayer()
+    return ambient_player
@@ -0,0 +1,107 @@
+import hashlib
+import os
+import threading
+from PIL import Image
+from config.paths import THUMBNAIL_DIR
+
+
+class AssetCache:
+    """
+    Decoded and resized images, shared across screen rebuilds.
+
+    Each (path, size, scale) is decoded and resampled once per process and
+    the resulting CTkImage/PhotoImage objects are reused, so rebuilding the
+    main screen after every break does no disk or PIL work. Resized images
+    can also be kept as small PNG thumbnails on disk, which makes the first
+    load after a restart cheap even for large multi-resolution .ico files.
+    """
+    def __init__(self, thumbnail_dir=THUMBNAIL_DIR, use_thumbnails=True):
+        self.thumbnail_dir = thumbnail_dir
+        self.use_thumbnails = use_thumbnails
+        self._images = {}
+        self._ctk_images = {}
+        self._photo_images = {}
+        self._lock = threading.Lock()
+
+    def _thumbnail_path(self, path, pixel_size):
+        st = os.stat(path)
+        key = f"{os.path.abspath(path)}|{st.st_mtime}|{st.st_size}|{pixel_size}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.thumbnail_dir, f"{digest}.png")
+
+    def _decode(self, path, pixel_size):
+        thumb_path = None
+        if self.use_thumbnails:
+            try:
+                thumb_path = self._thumbnail_path(path, pixel_size)
+                if os.path.exists(thumb_path):
+                    with Image.open(thumb_path) as thumb:
+                        return thumb.copy()
+            except Exception:
+                thumb_path = None
+
+        with Image.open(path) as src:
+            img = src.convert("RGBA").resize(pixel_size, Image.LANCZOS)
+
+        if thumb_path:
+            try:
+                os.makedirs(self.thumbnail_dir, exist_ok=True)
+                tmp_path = thumb_path + ".tmp"
+                img.save(tmp_path, format="PNG")
+                os.replace(tmp_path, thumb_path)
+            except Exception as e:
+                print("Thumbnail save error:", e)
+        return img
+
+    def image(self, path, size, scale=1.0):
+        """PIL image of path resized to size * scale (decoded once)."""
+        pixel_size = (int(size[0] * scale), int(size[1] * scale))
+        key = (os.path.abspath(path), pixel_size)
+        with self._lock:
+            img = self._images.get(key)
+        if img is None:
+            img = self._decode(path, pixel_size)
+            with self._lock:
+                img = self._images.setdefault(key, img)
+        return img
+
+    def ctk_image(self, path, size, scale=1.0):
+        """Shared CTkImage displayed at size, rendered from a size * scale source."""
+        import customtkinter as ctk
+        key = (os.path.abspath(path), tuple(size), scale)
+        with self._lock:
+            img = self._ctk_images.get(key)
+        if img is None:
+            source = self.image(path, size, scale)
+            img = ctk.CTkImage(light_image=source, dark_image=source, size=tuple(size))
+            with self._lock:
+                img = self._ctk_images.setdefault(key, img)
+        return img
+
+    def photo_image(self, path, size, scale=1.0):
+        """Shared ImageTk.PhotoImage; must be called on the Tk thread."""
+        from PIL import ImageTk
+        key = (os.path.abspath(path), tuple(size), scale)
+        img = self._photo_images.get(key)
+        if img is None:
+            img = ImageTk.PhotoImage(self.image(path, size, scale))
+            self._photo_images[key] = img
+        return img
+
+    def preload(self, specs):
+        """Decode (path, size) pairs ahead of time, e.g. from a background thread."""
+        for path, size in specs:
+            try:
+                self.image(path, size)
+            except Exception as e:
+                print(f"Asset preload error ({path}): {e}")
+
+
+# Global cache instance
+asset_cache = None
+
+def get_asset_cache():
+    global asset_cache
+    if asset_cache is None:
+        asset_cache = AssetCache()
+    return asset_cache
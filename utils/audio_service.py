@@ -0,0 +1,113 @@
+import os
+import threading
+from config.settings import load_settings
+
+# pygame's own mixer defaults: 44.1 kHz, signed 16-bit, stereo
+DEFAULT_MIXER_FORMAT = (44100, -16, 2)
+# small buffer for low-latency playback; raise it if audio crackles
+DEFAULT_BUFFER = 512
+
+
+class AudioService:
+    """
+    Initializes pygame/SDL audio lazily on a background thread.
+
+    Importing pygame loads SDL and initializing the mixer opens the audio
+    device, both of which used to block the window from painting. start()
+    does that work off the Tk thread; players call wait_ready() before
+    touching the mixer, and on_ready() callbacks fire once it is up.
+    """
+    def __init__(self):
+        self.ready = threading.Event()
+        self.error = None
+        self._thread = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._config = None
+
+    def configured_format(self):
+        """(frequency, size, channels) from settings, before or after init."""
+        if self._config is None:
+            settings = load_settings()
+            freq, size, channels = DEFAULT_MIXER_FORMAT
+            self._config = {
+                "frequency": int(settings.get("audio_frequency", freq)),
+                "size": int(settings.get("audio_size", size)),
+                "channels": int(settings.get("audio_channels", channels)),
+                "buffer": int(settings.get("audio_buffer", DEFAULT_BUFFER)),
+            }
+        c = self._config
+        return c["frequency"], c["size"], c["channels"]
+
+    def mixer_format(self):
+        """Actual mixer format once ready, otherwise the configured one."""
+        if self.ready.is_set():
+            import pygame
+            init = pygame.mixer.get_init()
+            if init:
+                return init
+        return self.configured_format()
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._init, daemon=True)
+            self._thread.start()
+
+    def _init(self):
+        try:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            import pygame
+            frequency, size, channels = self.configured_format()
+            pygame.mixer.init(frequency=frequency, size=size, channels=channels,
+                              buffer=self._config["buffer"])
+        except Exception as e:
+            print("Audio init error:", e)
+            self.error = e
+        self.ready.set()
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print("Audio ready callback error:", e)
+
+    def is_ready(self):
+        return self.ready.is_set() and self.error is None
+
+    def wait_ready(self, timeout=None):
+        """Start initialization if needed and wait for it; True if audio works."""
+        self.start()
+        self.ready.wait(timeout)
+        return self.is_ready()
+
+    def ready_for_playback(self, timeout):
+        """
+        wait_ready(timeout) on background threads. On the main (Tk) thread
+        it only starts init and reports readiness, so the UI never waits on
+        the audio device; callers there use on_ready() to try again.
+        """
+        if threading.current_thread() is threading.main_thread():
+            self.start()
+            return self.is_ready()
+        return self.wait_ready(timeout)
+
+    def on_ready(self, callback):
+        """Run callback (on the audio thread) once init has finished."""
+        with self._lock:
+            if not self.ready.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+# Global service instance
+audio_service = None
+
+def get_audio_service():
+    global audio_service
+    if audio_service is None:
+        audio_service = AudioService()
+    return audio_service
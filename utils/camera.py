@@ -1,14 +1,37 @@
 import cv2 
 import math
+import os
+import threading
 import numpy as np
 from collections import deque
 import time
+from utils.gaze import estimate_gaze, is_looking_at_screen, GAZE_Y_LIMIT
+from utils.governor import DetectionGovernor
+from config.paths import DIAGNOSTICS_DIR
+from config.session import session
+from config.settings import load_settings
+
+# luminance-only formats first; see PeekingDetector._negotiate_capture()
+CAPTURE_MODES = ["yuyv", "mjpg_gray", "bgr"]
+
+# Frame recorder (opt-in): "frame_recorder": true in settings.json or
+# EYECARE_FRAME_RECORDER=1. Defaults keep 30 s at 10 fps of 160x120 frames,
+# about 5.8 MB.
+RECORDER_ENV_FLAG = "EYECARE_FRAME_RECORDER"
+RECORDER_SECONDS = 30
+RECORDER_FPS = 10
+RECORDER_SIZE = (160, 120)
+# dump automatically when a single break has been reset this many times
+RECORDER_RESET_DUMP = 3
 
 class PeekingDetector:
     def __init__(self):
         # Camera initialization with optimized settings
         self.cap = self._initialize_camera()
         self.detector = self._initialize_detector()
+        # picks resolution and cascade parameters to fit the CPU budget
+        self.governor = DetectionGovernor()
+        self.recorder = get_frame_recorder()
         
         # Detection parameters
         self.detection_window = deque(maxlen=5)
@@ -28,16 +51,71 @@ class PeekingDetector:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         cap.set(cv2.CAP_PROP_FPS, 60)
-        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 2)  # Reduce latency
+        self.capture_mode = self._negotiate_capture(cap, load_settings().get("camera_capture_mode", "auto"))
         return cap
 
+    def _negotiate_capture(self, cap, preferred):
+        """
+        Pick the cheapest capture format the camera and backend support.
+
+        Detection only needs luminance: "yuyv" reads raw YUYV and keeps just
+        the Y bytes (one contiguous copy, half the frame); "mjpg_gray" reads
+        undecoded MJPG and lets libjpeg decode straight to half-size
+        grayscale; "bgr" is the old full-color decode. Color is only
+        produced for the preview.
+        """
+        if preferred != "auto" and preferred not in CAPTURE_MODES:
+            print(f"[Camera] Unknown capture mode {preferred!r}, using auto")
+            preferred = "auto"
+        modes = CAPTURE_MODES if preferred == "auto" else [preferred]
+        for mode in modes:
+            if self._try_capture(cap, mode):
+                print(f"[Camera] Capture mode: {mode}")
+                return mode
+        # nothing worked: put the camera back in the driver's default
+        # converted-BGR mode rather than the last format tried
+        if "bgr" not in modes and self._try_capture(cap, "bgr"):
+            print("[Camera] Capture mode: bgr")
+        elif "bgr" not in modes:
+            print("[Camera] No capture mode delivered a usable frame; using bgr")
+        return "bgr"
+
+    def _try_capture(self, cap, mode):
+        fourcc = 'YUYV' if mode == "yuyv" else 'MJPG'
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        cap.set(cv2.CAP_PROP_CONVERT_RGB, 1 if mode == "bgr" else 0)
+        self.frame_size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 640,
+                           int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 480)
+        ret, buf = cap.read()
+        return ret and self._split(mode, buf)[0] is not None
+
+    def _split(self, mode, buf):
+        """(grayscale image, preview scale, source buffer) for a captured buffer."""
+        try:
+            if mode == "yuyv":
+                w, h = self.frame_size
+                raw = buf.reshape(h, w, 2)
+                # Y is every other byte; cv2 would copy that strided view on
+                # every call, so copy it once here
+                return np.ascontiguousarray(raw[:, :, 0]), 1, raw
+            if mode == "mjpg_gray":
+                data = buf.reshape(-1)
+                if data.size < 2 or data[0] != 0xFF or data[1] != 0xD8:
+                    return None, 1, buf
+                gray = cv2.imdecode(data, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+                return gray, 2, data
+            if buf.ndim == 3 and buf.shape[2] == 3:
+                return cv2.cvtColor(buf, cv2.COLOR_BGR2GRAY), 1, buf
+        except Exception as e:
+            print(f"[Camera] Unexpected {mode} frame: {e}")
+        return None, 1, buf
+
     def _initialize_detector(self):
+        # eyes are located from the face box by utils.gaze, no eye cascade
         face_cascade = cv2.CascadeClassifier(
             cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
-        eye_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + "haarcascade_eye.xml")
-        return {'face': face_cascade, 'eye': eye_cascade}
+        return {'face': face_cascade}
 
     def release(self):
         """Release camera safely"""
@@ -60,53 +138,74 @@ class PeekingDetector:
         return vertical_angle, horizontal_angle
 
     def analyze_frame(self, frame):
+        """Analyze a BGR frame."""
+        return self.analyze(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), ("bgr", frame), 1)
+
+    def analyze(self, gray, source, preview_scale):
+        """
+        Analyze a grayscale frame. source is (capture mode, buffer), used
+        only if a color preview is requested (see color_frame()); face box
+        and landmarks are reported in preview coordinates.
+        """
+        started = self.governor.measure()
+        try:
+            return self._analyze(gray, source, preview_scale, self.governor.params())
+        finally:
+            self.governor.record(started)
+
+    def _analyze(self, gray, source, preview_scale, params):
         result = {
-            'frame': frame.copy(),
+            'frame': source[1] if source[0] == "bgr" else None,
+            'source': source,
+            'face_rect': None,
             'face_detected': False,
             'peeking': False,
             'message': "No face detected",
             'vert_angle': 0,
             'horiz_angle': 0,
             'landmarks': [],
+            'gaze': None,
+            'quality': self.governor.tier['name'],
             'is_black': False
         }
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        gray = cv2.equalizeHist(gray)
-        if np.mean(gray) < 30:
+        scale = params['scale']
+        small = gray if scale == 1.0 else cv2.resize(gray, None, fx=scale, fy=scale,
+                                                     interpolation=cv2.INTER_AREA)
+        small = cv2.equalizeHist(small)
+        if np.mean(small) < 30:
             result['message'] = "Low lighting"
             result['is_black'] = True
             return result
-        faces = self.detector['face'].detectMultiScale(gray, scaleFactor=1.05,
-                                                       minNeighbors=6, minSize=(80, 80),
+        faces = self.detector['face'].detectMultiScale(small, scaleFactor=params['scaleFactor'],
+                                                       minNeighbors=params['minNeighbors'],
+                                                       minSize=tuple(max(24, v // preview_scale) for v in params['minSize']),
                                                        flags=cv2.CASCADE_SCALE_IMAGE)
         if len(faces) == 0:
             return result
-        x, y, w, h = max(faces, key=lambda f: f[2]*f[3])
+        x, y, w, h = (int(v / scale) for v in max(faces, key=lambda f: f[2]*f[3]))
         result['face_detected'] = True
-        cv2.rectangle(result['frame'], (x, y), (x+w, y+h), (0, 255, 0), 2)
-        roi_gray = gray[y:y+h, x:x+w]
-        eyes = self.detector['eye'].detectMultiScale(roi_gray, scaleFactor=1.05,
-                                                     minNeighbors=5, minSize=(30, 30))
-        if len(eyes) < 2:
+        p = preview_scale
+        result['face_rect'] = (x * p, y * p, w * p, h * p)
+        gaze = estimate_gaze(gray, (x, y, w, h))
+        if gaze is None:
             result['message'] = "Eyes not detected"
             return result
-        eyes = sorted(eyes, key=lambda e: e[0])[:2]
-        eye_centers = [(x + ex + ew//2, y + ey + eh//2) for ex, ey, ew, eh in eyes]
-        result['landmarks'] = eye_centers
-        for center in eye_centers:
-            cv2.circle(result['frame'], center, 5, (0, 0, 255), -1)
-        cv2.line(result['frame'], eye_centers[0], eye_centers[1], (255, 0, 0), 2)
+        eye_centers = gaze['pupils']
+        result['landmarks'] = [(ex * p, ey * p) for ex, ey in eye_centers]
+        result['gaze'] = (gaze['gaze_x'], gaze['gaze_y'])
         vert_angle, horiz_angle = self.get_face_orientation((x, y, w, h), eye_centers)
         result['vert_angle'] = vert_angle
         result['horiz_angle'] = horiz_angle
-        eye_y_mean = (eye_centers[0][1] + eye_centers[1][1]) / 2
-        eye_ratio = (eye_y_mean - y) / h
+        # pupils are only searched inside the eye regions, so vertical gaze
+        # comes from their position within those boxes, not the face box
         if abs(vert_angle) > 40 or abs(horiz_angle) > 25:
             result['message'] = f"Head turned ({vert_angle:.1f}°, {horiz_angle:.1f}°)"
-        elif eye_ratio < 0.25:
+        elif gaze['gaze_y'] < -GAZE_Y_LIMIT:
             result['message'] = "Looking up"
-        elif eye_ratio > 0.6:
+        elif gaze['gaze_y'] > GAZE_Y_LIMIT:
             result['message'] = "Looking down"
+        elif not is_looking_at_screen(gaze):
+            result['message'] = f"Looking away ({gaze['gaze_x']:+.2f}, {gaze['gaze_y']:+.2f})"
         else:
             result['peeking'] = True
             result['message'] = "Looking at screen"
@@ -114,19 +213,24 @@ class PeekingDetector:
 
     def is_user_peeking(self):
         self.frame_count += 1
-        ret, frame = self.cap.read()
-        if not ret:
+        ret, buf = self.cap.read()
+        gray, preview_scale, raw = self._split(self.capture_mode, buf) if ret else (None, 1, None)
+        if gray is None:
             return False, self._create_error_result("Camera error")
+        source = (self.capture_mode, raw)
         current_time = time.time()
         if current_time - self.last_processed_time < self.processing_interval:
             if self.last_valid_result:
                 result = self.last_valid_result.copy()
-                result['frame'] = frame
+                result['source'] = source
+                result['frame'] = raw if self.capture_mode == "bgr" else None
                 result['message'] = "Throttling"
                 return False, result
-            return False, self._create_default_result(frame)
+            return False, self._create_default_result(source)
         self.last_processed_time = current_time
-        analysis = self.analyze_frame(frame)
+        analysis = self.analyze(gray, source, preview_scale)
+        if self.recorder:
+            self.recorder.record(gray, analysis, preview_scale)
         self.detection_window.append(analysis['peeking'])
         if analysis['face_detected']:
             self.last_valid_result = analysis
@@ -134,8 +238,9 @@ class PeekingDetector:
                       if self.detection_window else 0)
         return confidence >= self.required_confidence, analysis
 
-    def _create_default_result(self, frame):
-        return {'frame': frame, 'face_detected': False, 'peeking': False,
+    def _create_default_result(self, source):
+        return {'frame': source[1] if source[0] == "bgr" else None, 'source': source,
+                'face_detected': False, 'peeking': False,
                 'message': "Ready", 'vert_angle': 0, 'horiz_angle': 0,
                 'landmarks': []}
 
@@ -147,6 +252,149 @@ class PeekingDetector:
                 'message': message, 'vert_angle': 0, 'horiz_angle': 0,
                 'landmarks': []}
 
+def color_frame(analysis):
+    """
+    Annotated BGR preview for an analysis; the only place color is decoded
+    in the luminance capture modes, so it costs nothing unless shown.
+    """
+    frame = analysis.get('frame')
+    if frame is not None:
+        frame = frame.copy()
+    else:
+        mode, buf = analysis.get('source') or (None, None)
+        if mode == "yuyv":
+            frame = cv2.cvtColor(buf, cv2.COLOR_YUV2BGR_YUYV)
+        elif mode == "mjpg_gray":
+            frame = cv2.imdecode(buf, cv2.IMREAD_COLOR)
+        if frame is None:
+            frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    rect = analysis.get('face_rect')
+    if rect:
+        x, y, w, h = rect
+        cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+        centers = analysis.get('landmarks') or []
+        for center in centers:
+            cv2.circle(frame, center, 5, (0, 0, 255), -1)
+        if len(centers) == 2:
+            cv2.line(frame, centers[0], centers[1], (255, 0, 0), 2)
+    return frame
+
+def frame_recorder_enabled():
+    """On with EYECARE_FRAME_RECORDER=1 or "frame_recorder": true in settings.json."""
+    env = os.environ.get(RECORDER_ENV_FLAG)
+    if env is not None:
+        return env.strip().lower() not in ("", "0", "false", "no")
+    return bool(load_settings().get("frame_recorder", False))
+
+
+class FrameRecorder:
+    """
+    Ring buffer of the last few seconds of analyzed frames, for reproducing
+    detection problems.
+
+    Frames are downscaled straight into a preallocated (capacity, h, w)
+    uint8 array by cv2.resize(dst=...), so recording adds exactly one copy
+    per frame and memory never grows. The source must be the contiguous
+    grayscale image from _split() (cv2 would copy a strided view such as
+    the raw YUYV Y bytes first). The analysis results kept alongside are
+    a handful of scalars per slot. dump() writes the buffer oldest-first
+    to DIAGNOSTICS_DIR as a compressed .npz, on demand or automatically
+    when a break is reset RECORDER_RESET_DUMP times.
+    """
+    def __init__(self, seconds=RECORDER_SECONDS, fps=RECORDER_FPS, size=RECORDER_SIZE,
+                 output_dir=DIAGNOSTICS_DIR):
+        self.size = size
+        self.capacity = max(1, int(seconds * fps))
+        self.interval = 1.0 / fps
+        self.output_dir = output_dir
+        width, height = size
+        self.frames = np.zeros((self.capacity, height, width), dtype=np.uint8)
+        self.times = np.zeros(self.capacity, dtype=np.float64)
+        self.face_detected = np.zeros(self.capacity, dtype=bool)
+        self.peeking = np.zeros(self.capacity, dtype=bool)
+        self.is_black = np.zeros(self.capacity, dtype=bool)
+        self.gaze = np.full((self.capacity, 2), np.nan, dtype=np.float32)
+        self.face_rect = np.full((self.capacity, 4), -1, dtype=np.int16)
+        self.landmarks = np.full((self.capacity, 2, 2), -1, dtype=np.int16)
+        self.messages = [""] * self.capacity
+        self.quality = [""] * self.capacity
+        self.head = 0
+        self.count = 0
+        self._last = 0.0
+        self._lock = threading.Lock()
+        session.subscribe("break_resets", self._on_reset)
+
+    def record(self, gray, analysis, preview_scale=1):
+        now = time.time()
+        if now - self._last < self.interval:
+            return
+        self._last = now
+        # recorded coordinates from preview coordinates
+        factor = self.size[0] / (gray.shape[1] * preview_scale)
+        if not gray.flags['C_CONTIGUOUS']:
+            # would cost an extra copy inside cv2; _split() never hands these out
+            gray = np.ascontiguousarray(gray)
+        with self._lock:
+            i = self.head
+            cv2.resize(gray, self.size, dst=self.frames[i], interpolation=cv2.INTER_AREA)
+            self.times[i] = now
+            self.face_detected[i] = analysis.get('face_detected', False)
+            self.peeking[i] = analysis.get('peeking', False)
+            self.is_black[i] = analysis.get('is_black', False)
+            self.gaze[i] = analysis.get('gaze') or (np.nan, np.nan)
+            rect = analysis.get('face_rect')
+            self.face_rect[i] = [int(v * factor) for v in rect] if rect else -1
+            landmarks = analysis.get('landmarks') or []
+            self.landmarks[i] = ([[int(x * factor), int(y * factor)] for x, y in landmarks]
+                                 if len(landmarks) == 2 else -1)
+            self.messages[i] = analysis.get('message', "")
+            self.quality[i] = analysis.get('quality', "")
+            self.head = (i + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def _on_reset(self, key, old, new):
+        if new == RECORDER_RESET_DUMP:
+            self.dump("resets")
+
+    def dump(self, reason="manual"):
+        """Write the buffer in the background; returns the file path, or None if empty."""
+        with self._lock:
+            if not self.count:
+                return None
+            order = (np.arange(self.count) + self.head - self.count) % self.capacity
+            data = {
+                "frames": self.frames[order], "times": self.times[order],
+                "face_detected": self.face_detected[order], "peeking": self.peeking[order],
+                "is_black": self.is_black[order], "gaze": self.gaze[order],
+                "face_rect": self.face_rect[order], "landmarks": self.landmarks[order],
+                "message": np.array([self.messages[i] for i in order]),
+                "quality": np.array([self.quality[i] for i in order]),
+            }
+        path = os.path.join(self.output_dir, f"frames-{time.strftime('%Y%m%d-%H%M%S')}-{reason}.npz")
+
+        def write():
+            try:
+                os.makedirs(self.output_dir, exist_ok=True)
+                np.savez_compressed(path, **data)
+                print(f"[Camera] {len(order)} recorded frames written to {path}")
+            except Exception as e:
+                print("Frame recorder dump error:", e)
+        threading.Thread(target=write, daemon=True).start()
+        return path
+
+# Global recorder instance; None unless enabled
+frame_recorder = None
+
+def get_frame_recorder():
+    global frame_recorder
+    if frame_recorder is None and frame_recorder_enabled():
+        frame_recorder = FrameRecorder()
+    return frame_recorder
+
+def dump_frame_recorder(reason="manual"):
+    recorder = get_frame_recorder()
+    return recorder.dump(reason) if recorder else None
+
 # Global detector instance
 detector = None
 
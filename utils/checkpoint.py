@@ -0,0 +1,135 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from config.paths import TIMER_STATE_PATH
+from config.session import session, PHASE_WORKING, PHASE_ALARM, PHASE_BREAK
+from utils.helpers import chmod_default
+
+# writes within this window are coalesced into one
+WRITE_DEBOUNCE_SECONDS = 0.5
+# and never happen more often than this
+MIN_WRITE_INTERVAL_SECONDS = 2.0
+# a missed alarm or interrupted break older than this is not brought back
+STALE_AFTER_SECONDS = 10 * 60
+
+
+class TimerCheckpoint:
+    """
+    Crash-safe record of the timer's phase and deadline.
+
+    Subscribes to session "phase" and "timer_deadline", which only change
+    on screen transitions and timer starts, so there is nothing to write
+    while the countdown runs. Changes are debounced and rate limited and
+    written as temp-file-plus-rename. The deadline is wall-clock time, so
+    it survives restarts and reboots; see resume_action() for how a saved
+    state is brought back.
+    """
+    def __init__(self, path=TIMER_STATE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = None
+        self._write_timer = None
+        self._last_write = 0.0
+        self._unsubscribe = []
+
+    def attach(self, state=session):
+        self._unsubscribe = [state.subscribe("phase", self._on_change),
+                             state.subscribe("timer_deadline", self._on_change)]
+        atexit.register(self.flush)
+
+    def _on_change(self, key, old, new):
+        self.save(session.get("phase"), session.get("timer_deadline"))
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print("Timer state load error:", e)
+            return None
+
+    def save(self, phase, deadline):
+        with self._lock:
+            self._pending = {"phase": phase, "deadline": deadline, "saved_at": time.time()}
+            if self._write_timer:
+                self._write_timer.cancel()
+            delay = max(WRITE_DEBOUNCE_SECONDS,
+                        self._last_write + MIN_WRITE_INTERVAL_SECONDS - time.monotonic())
+            self._write_timer = threading.Timer(delay, self.flush)
+            self._write_timer.daemon = True
+            self._write_timer.start()
+
+    def flush(self):
+        """Write the pending state now."""
+        with self._lock:
+            if self._pending is None:
+                return
+            if self._write_timer:
+                self._write_timer.cancel()
+                self._write_timer = None
+            state, self._pending = self._pending, None
+            self._last_write = time.monotonic()
+            self._write(state)
+
+    def _write(self, state):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".timer-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            chmod_default(tmp_path)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print("Timer state save error:", e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def resume_action(state, now=None):
+    """
+    What to do with a saved state on startup, corrected for the time the
+    app was closed:
+
+      ("resume", seconds_left)  the work timer was running and hasn't expired
+      ("alarm", None)           it expired, or an alarm/break was cut short,
+                                less than STALE_AFTER_SECONDS ago
+      ("idle", None)            anything else (including long absences,
+                                which count as a break)
+    """
+    if not state:
+        return "idle", None
+    now = now if now is not None else time.time()
+    phase = state.get("phase")
+    deadline = state.get("deadline")
+    if phase == PHASE_WORKING and deadline:
+        if deadline > now:
+            return "resume", deadline - now
+        if now - deadline < STALE_AFTER_SECONDS:
+            return "alarm", None
+    elif phase in (PHASE_ALARM, PHASE_BREAK):
+        if now - state.get("saved_at", 0) < STALE_AFTER_SECONDS:
+            return "alarm", None
+    return "idle", None
+
+
+# Global checkpoint instance
+timer_checkpoint = None
+
+def get_timer_checkpoint():
+    global timer_checkpoint
+    if timer_checkpoint is None:
+        timer_checkpoint = TimerCheckpoint()
+    return timer_checkpoint
+
+def start_timer_checkpoint():
+    """Start checkpointing timer state changes."""
+    checkpoint = get_timer_checkpoint()
+    checkpoint.attach()
+    return checkpoint
@@ -0,0 +1,289 @@
+import atexit
+import collections
+import gc
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from config.paths import DIAGNOSTICS_DIR
+from config.settings import load_settings
+
+ENV_FLAG = "EYECARE_DIAGNOSTICS"
+SAMPLE_INTERVAL_MS = 60 * 1000
+TRACEMALLOC_FRAMES = 10
+TOP_ALLOCATIONS = 25
+TOP_FUNCTIONS = 40
+
+
+def diagnostics_enabled():
+    """On with EYECARE_DIAGNOSTICS=1 or "diagnostics": true in settings.json."""
+    env = os.environ.get(ENV_FLAG)
+    if env is not None:
+        return env.strip().lower() not in ("", "0", "false", "no")
+    return bool(load_settings().get("diagnostics", False))
+
+
+class _ProfileSnapshot:
+    """Stats of a running cProfile.Profile; pstats would otherwise disable it."""
+    def __init__(self, profile):
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self):
+        pass
+
+
+class Diagnostics:
+    """
+    Opt-in profiling and leak tracking.
+
+    When enabled, the Tk main loop and every thread started afterwards run
+    under cProfile, tracemalloc takes a snapshot at each screen transition
+    (session "phase" change) and logs what grew since the previous one, and
+    live CTkImage/PhotoImage/pending-after() counts and, while the camera
+    runs, the detection governor's tier and load are sampled every
+    minute. Reports go to DIAGNOSTICS_DIR on exit, on Ctrl+Shift+D, and
+    every transition writes a line to transitions.jsonl. Snapshots, the
+    gc object scan and reports run on a diagnostics worker thread, so the
+    probe doesn't stall the Tk thread it is measuring. Disabled, every
+    method is a no-op.
+    """
+    def __init__(self, enabled=None, output_dir=DIAGNOSTICS_DIR):
+        self.enabled = diagnostics_enabled() if enabled is None else enabled
+        self.output_dir = os.path.join(output_dir, time.strftime("%Y%m%d-%H%M%S"))
+        self.app = None
+        self._profiles = []
+        self._profiles_lock = threading.Lock()
+        self._pending_after = {}
+        self._last_snapshot = None
+        self._started = False
+        self._jobs = queue.Queue()
+
+    # --- setup ---
+    def start(self):
+        """Begin tracing; call before the app and its threads are created."""
+        if not self.enabled or self._started:
+            return
+        self._started = True
+        import tracemalloc
+        os.makedirs(self.output_dir, exist_ok=True)
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._last_snapshot = tracemalloc.take_snapshot()
+        threading.Thread(target=self._work, name="diagnostics", daemon=True).start()
+        self._profile_threads()
+        from config.session import session
+        session.subscribe("phase", self._on_transition)
+        atexit.register(self.dump)
+        print(f"Diagnostics enabled, writing to {self.output_dir}")
+
+    def _profile_threads(self):
+        import cProfile
+        diagnostics = self
+        original_run = threading.Thread.run
+
+        def run(thread):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ allows one active cProfile per process
+                original_run(thread)
+                return
+            with diagnostics._profiles_lock:
+                diagnostics._profiles.append((thread.name, profile))
+            try:
+                original_run(thread)
+            finally:
+                profile.disable()
+
+        threading.Thread.run = run
+
+    def attach(self, app):
+        """Count pending after() callbacks and bind the dump shortcut."""
+        if not self.enabled:
+            return
+        self.start()
+        self.app = app
+        import tkinter
+        # patched on tkinter.Misc, so callbacks scheduled by any widget
+        # (after_idle goes through after() too) are counted, not just the
+        # app window's
+        original_after = tkinter.Misc.after
+        original_cancel = tkinter.Misc.after_cancel
+        pending = self._pending_after
+        self._after = lambda ms, func: original_after(app, ms, func)
+
+        def after(widget, ms, func=None, *args):
+            if func is None:
+                return original_after(widget, ms)
+            holder = []
+
+            def callback(*a):
+                if holder:
+                    pending.pop(holder[0], None)
+                return func(*a)
+            callback.__name__ = getattr(func, "__name__", "callback")
+            after_id = original_after(widget, ms, callback, *args)
+            holder.append(after_id)
+            pending[after_id] = getattr(func, "__qualname__", repr(func))
+            return after_id
+
+        def after_cancel(widget, after_id):
+            pending.pop(after_id, None)
+            return original_cancel(widget, after_id)
+
+        tkinter.Misc.after = after
+        tkinter.Misc.after_cancel = after_cancel
+        app.bind_all("<Control-Shift-D>", lambda e: self._jobs.put((self.dump, ())), add="+")
+        self._after(SAMPLE_INTERVAL_MS, self._sample)
+
+    def run_mainloop(self, app):
+        """app.mainloop(), profiled when diagnostics are on."""
+        if not self.enabled:
+            app.mainloop()
+            return
+        import cProfile
+        self.attach(app)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            app.mainloop()
+            return
+        with self._profiles_lock:
+            self._profiles.append(("MainThread", profile))
+        try:
+            app.mainloop()
+        finally:
+            profile.disable()
+
+    # --- measurements ---
+    def counts(self):
+        """Live image objects and pending after() callbacks."""
+        types = {}
+        if "customtkinter" in sys.modules:
+            types["CTkImage"] = sys.modules["customtkinter"].CTkImage
+        if "PIL.ImageTk" in sys.modules:
+            types["ImageTk.PhotoImage"] = sys.modules["PIL.ImageTk"].PhotoImage
+        if "tkinter" in sys.modules:
+            types["tk.PhotoImage"] = sys.modules["tkinter"].PhotoImage
+        result = dict.fromkeys(types, 0)
+        for obj in gc.get_objects():
+            for name, cls in types.items():
+                if isinstance(obj, cls):
+                    result[name] += 1
+        result["pending_after"] = len(self._pending_after)
+        result["threads"] = threading.active_count()
+        return result
+
+    def _memory(self):
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        return {"traced_kb": current // 1024, "peak_kb": peak // 1024}
+
+    def _detection(self):
+        # only a detector that is already running; sampling mustn't open the camera
+        camera = sys.modules.get("utils.camera")
+        detector = getattr(camera, "detector", None)
+        if detector is None:
+            return {}
+        return {"detection": detector.governor.report()}
+
+    def _record(self, filename, entry):
+        try:
+            with open(os.path.join(self.output_dir, filename), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except Exception as e:
+            print("Diagnostics write error:", e)
+
+    def _work(self):
+        while True:
+            func, args = self._jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                print("Diagnostics error:", e)
+
+    def _sample(self):
+        self._jobs.put((self._write_sample, (time.time(),)))
+        try:
+            self._after(SAMPLE_INTERVAL_MS, self._sample)
+        except Exception:
+            pass
+
+    def _write_sample(self, when):
+        self._record("samples.jsonl", {"time": when, **self.counts(), **self._memory(),
+                                         **self._detection()})
+
+    def _on_transition(self, key, old, new):
+        # called on whichever thread changed the phase, often the Tk thread
+        self._jobs.put((self._write_transition, (old, new, time.time())))
+
+    def _write_transition(self, old, new, when):
+        import tracemalloc
+        snapshot = tracemalloc.take_snapshot()
+        growth = snapshot.compare_to(self._last_snapshot, "lineno")[:TOP_ALLOCATIONS]
+        self._last_snapshot = snapshot
+        self._record("transitions.jsonl", {
+            "time": when, "from": old, "to": new, **self.counts(), **self._memory(),
+            "top_growth": [{"where": str(stat.traceback), "size_diff_kb": stat.size_diff // 1024,
+                            "count_diff": stat.count_diff} for stat in growth if stat.size_diff > 0],
+        })
+
+    # --- reports ---
+    def dump(self):
+        """Write profiles, top allocations and current counts to the output folder."""
+        if not self.enabled or not self._started:
+            return
+        import pstats
+        import tracemalloc
+        stamp = time.strftime("%H%M%S")
+        try:
+            with self._profiles_lock:
+                profiles = list(self._profiles)
+            combined = None
+            by_thread = collections.Counter(name for name, _ in profiles)
+            for _, profile in profiles:
+                snapshot = _ProfileSnapshot(profile)
+                if not snapshot.stats:
+                    continue
+                if combined is None:
+                    combined = pstats.Stats(snapshot)
+                else:
+                    combined.add(snapshot)
+            if combined:
+                combined.dump_stats(os.path.join(self.output_dir, f"profile-{stamp}.prof"))
+                with open(os.path.join(self.output_dir, f"profile-{stamp}.txt"), "w") as f:
+                    f.write(f"threads profiled: {dict(by_thread)}\n\n")
+                    combined.stream = f
+                    combined.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+            snapshot = tracemalloc.take_snapshot()
+            with open(os.path.join(self.output_dir, f"memory-{stamp}.txt"), "w") as f:
+                f.write(json.dumps({**self.counts(), **self._memory()}, indent=2) + "\n\n")
+                f.write("Pending after() callbacks:\n")
+                for name, count in collections.Counter(self._pending_after.values()).most_common():
+                    f.write(f"  {count:5d}  {name}\n")
+                f.write("\nTop allocations:\n")
+                for stat in snapshot.statistics("traceback")[:TOP_ALLOCATIONS]:
+                    f.write(f"{stat}\n")
+                    for line in stat.traceback.format():
+                        f.write(f"    {line}\n")
+            camera = sys.modules.get("utils.camera")
+            if camera is not None:
+                camera.dump_frame_recorder("diagnostics")
+            print(f"Diagnostics report written to {self.output_dir}")
+        except Exception as e:
+            print("Diagnostics dump error:", e)
+
+
+# Global instance
+diagnostics = None
+
+def get_diagnostics():
+    global diagnostics
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    return diagnostics
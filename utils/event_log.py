@@ -0,0 +1,283 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from config.paths import EVENT_LOG_PATH
+from config.session import session, PHASE_ALARM, PHASE_BREAK, PHASE_POST_BREAK
+
+# Event types
+EVENT_ALARM_FIRED = "alarm_fired"          # alarm overlay shown
+EVENT_BREAK_STARTED = "break_started"      # value: seconds from alarm to "Start Break"
+EVENT_BREAK_RESET = "break_reset"          # value: resets so far in this break
+EVENT_BREAK_COMPLETED = "break_completed"  # value: total resets in this break
+EVENT_BREAK_SKIPPED = "break_skipped"      # alarm dismissed or app closed without a break
+
+BATCH_SIZE = 100
+FLUSH_INTERVAL_SECONDS = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    type TEXT NOT NULL,
+    break_id INTEGER,
+    value REAL,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, ts);
+CREATE TABLE IF NOT EXISTS rollup_daily (
+    day TEXT PRIMARY KEY,
+    alarms INTEGER NOT NULL DEFAULT 0,
+    started INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    resets INTEGER NOT NULL DEFAULT 0,
+    latency_sum REAL NOT NULL DEFAULT 0,
+    latency_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS rollup_hourly (
+    hour INTEGER PRIMARY KEY,
+    alarms INTEGER NOT NULL DEFAULT 0,
+    started INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    resets INTEGER NOT NULL DEFAULT 0,
+    latency_sum REAL NOT NULL DEFAULT 0,
+    latency_count INTEGER NOT NULL DEFAULT 0
+);
+"""
+# bump when the rollup definition changes; rollups are rebuilt from events
+ROLLUP_VERSION = 1
+ROLLUP_COLUMNS = ["alarms", "started", "completed", "skipped", "resets", "latency_sum", "latency_count"]
+# event type -> rollup counter it increments
+ROLLUP_COUNTERS = {
+    EVENT_ALARM_FIRED: "alarms",
+    EVENT_BREAK_STARTED: "started",
+    EVENT_BREAK_COMPLETED: "completed",
+    EVENT_BREAK_SKIPPED: "skipped",
+    EVENT_BREAK_RESET: "resets",
+}
+
+
+def rollup_keys(ts):
+    """(local day 'YYYY-MM-DD', hour start as epoch seconds) for a timestamp."""
+    return time.strftime("%Y-%m-%d", time.localtime(ts)), int(ts // 3600) * 3600
+
+
+def rollup_deltas(rows):
+    """Aggregate (ts, type, value) rows into per-day and per-hour counter deltas."""
+    daily, hourly = {}, {}
+    for ts, event_type, value in rows:
+        counter = ROLLUP_COUNTERS.get(event_type)
+        if counter is None:
+            continue
+        day, hour = rollup_keys(ts)
+        for table, key in ((daily, day), (hourly, hour)):
+            delta = table.setdefault(key, dict.fromkeys(ROLLUP_COLUMNS, 0))
+            delta[counter] += 1
+            if event_type == EVENT_BREAK_STARTED and value is not None:
+                delta["latency_sum"] += value
+                delta["latency_count"] += 1
+    return daily, hourly
+
+
+def apply_rollups(conn, daily, hourly):
+    columns = ", ".join(ROLLUP_COLUMNS)
+    params = ", ".join("?" for _ in ROLLUP_COLUMNS)
+    increments = ", ".join(f"{c} = {c} + excluded.{c}" for c in ROLLUP_COLUMNS)
+    for table, key_column, deltas in (("rollup_daily", "day", daily), ("rollup_hourly", "hour", hourly)):
+        conn.executemany(
+            f"INSERT INTO {table} ({key_column}, {columns}) VALUES (?, {params}) "
+            f"ON CONFLICT({key_column}) DO UPDATE SET {increments}",
+            [(key, *(delta[c] for c in ROLLUP_COLUMNS)) for key, delta in deltas.items()])
+
+
+class EventLog:
+    """
+    Break-compliance history in a local SQLite database.
+
+    log() only puts the event on a queue; a background writer owns the
+    connection and commits in batches (every FLUSH_INTERVAL_SECONDS or
+    BATCH_SIZE events), so the Tk thread never waits on disk. The database
+    runs in WAL mode, so readers such as the stats screen don't block it.
+    Per-day and per-hour rollup tables are updated with every batch, so
+    statistics never need to rescan the raw events.
+    """
+    def __init__(self, path=EVENT_LOG_PATH):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def connect(self):
+        """Open a connection with the schema in place (one per thread)."""
+        import sqlite3
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < ROLLUP_VERSION:
+            self._rebuild_rollups(conn)
+        return conn
+
+    def _rebuild_rollups(self, conn):
+        """Recompute the rollup tables from the raw events (schema upgrades only)."""
+        with conn:
+            conn.execute("DELETE FROM rollup_daily")
+            conn.execute("DELETE FROM rollup_hourly")
+            cursor = conn.execute("SELECT ts, type, value FROM events ORDER BY ts")
+            while True:
+                rows = cursor.fetchmany(10000)
+                if not rows:
+                    break
+                apply_rollups(conn, *rollup_deltas(rows))
+            conn.execute(f"PRAGMA user_version = {ROLLUP_VERSION}")
+
+    def log(self, event_type, value=None, break_id=None, ts=None, **data):
+        """Record an event; never blocks."""
+        if self._closed:
+            return
+        self._queue.put((ts or time.time(), event_type, break_id, value,
+                         json.dumps(data) if data else None))
+        self._start()
+
+    def _run(self):
+        try:
+            conn = self.connect()
+        except Exception as e:
+            print("Event log open error:", e)
+            return
+        done = False
+        while not done:
+            batch = []
+            try:
+                item = self._queue.get()
+                deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+                while item is not None:
+                    batch.append(item)
+                    if len(batch) >= BATCH_SIZE:
+                        break
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                done = item is None
+            except queue.Empty:
+                pass
+            if batch:
+                try:
+                    with conn:
+                        self._write_batch(conn, batch)
+                except Exception as e:
+                    print("Event log write error:", e)
+        conn.close()
+
+    def _write_batch(self, conn, batch):
+        conn.executemany("INSERT INTO events (ts, type, break_id, value, data) VALUES (?, ?, ?, ?, ?)", batch)
+        # rollups are updated in the same transaction, so they always match the events
+        apply_rollups(conn, *rollup_deltas((ts, event_type, value) for ts, event_type, _, value, _ in batch))
+
+    def query(self, sql, params=()):
+        """Run a read query on a short-lived connection."""
+        conn = self.connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def close(self, timeout=2.0):
+        """Flush queued events and stop the writer."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+class BreakRecorder:
+    """
+    Turns session changes into events.
+
+    Subscribes to session "phase" and "break_resets", so the screens don't
+    need to know about the log. The alarm timestamp (in ms) doubles as the
+    break id tying one alarm's events together.
+    """
+    def __init__(self, event_log):
+        self.event_log = event_log
+        self.alarm_time = None
+        self.break_id = None
+        self._unsubscribe = []
+
+    def attach(self, state=session):
+        self._unsubscribe = [state.subscribe("phase", self._on_phase),
+                             state.subscribe("break_resets", self._on_reset)]
+        atexit.register(self.finish)
+
+    def detach(self):
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+
+    def _on_phase(self, key, old, new):
+        now = time.time()
+        if new == PHASE_ALARM:
+            self.alarm_time = now
+            self.break_id = int(now * 1000)
+            self.event_log.log(EVENT_ALARM_FIRED, break_id=self.break_id, ts=now)
+        elif new == PHASE_BREAK and old == PHASE_ALARM:
+            self.event_log.log(EVENT_BREAK_STARTED, value=now - self.alarm_time,
+                               break_id=self.break_id, ts=now)
+        elif new == PHASE_POST_BREAK:
+            self.event_log.log(EVENT_BREAK_COMPLETED, value=session.get("break_resets", 0),
+                               break_id=self.break_id, ts=now)
+            self.alarm_time = None
+        elif old == PHASE_ALARM:
+            self._skipped(now)
+
+    def _on_reset(self, key, old, new):
+        if new and session.get("phase") == PHASE_BREAK:
+            self.event_log.log(EVENT_BREAK_RESET, value=new, break_id=self.break_id,
+                               reason=session.get("camera_status"))
+
+    def _skipped(self, now):
+        if self.alarm_time is not None:
+            self.event_log.log(EVENT_BREAK_SKIPPED, value=now - self.alarm_time,
+                               break_id=self.break_id, ts=now, phase=session.get("phase"))
+            self.alarm_time = None
+
+    def finish(self):
+        """On exit: an alarm or break still in progress counts as skipped."""
+        if session.get("phase") in (PHASE_ALARM, PHASE_BREAK):
+            self._skipped(time.time())
+        self.detach()
+        self.event_log.close()
+
+
+# Global instances
+event_log = None
+break_recorder = None
+
+def get_event_log():
+    global event_log
+    if event_log is None:
+        event_log = EventLog()
+    return event_log
+
+def start_break_recorder():
+    """Begin recording break events from the session (idempotent)."""
+    global break_recorder
+    if break_recorder is None:
+        break_recorder = BreakRecorder(get_event_log())
+        break_recorder.attach()
+    return break_recorder
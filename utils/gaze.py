@@ -0,0 +1,119 @@
+import cv2
+import numpy as np
+
+# Eye regions as fractions of the face box (anatomical priors): each eye
+# sits EYE_TOP down and EYE_SIDE in from the edge, EYE_WIDTH x EYE_HEIGHT of
+# the face width in size
+EYE_TOP = 0.25
+EYE_SIDE = 0.13
+EYE_WIDTH = 0.35
+EYE_HEIGHT = 0.30
+
+# pupil search runs on the eye region scaled to this width
+PUPIL_ROI_WIDTH = 32
+# gradients weaker than mean + this many std devs are ignored
+GRADIENT_THRESHOLD = 0.3
+# best center must score this much above the average candidate; closed
+# eyes and featureless regions stay below ~1.7, visible pupils reach 5+
+MIN_PUPIL_CONTRAST = 2.5
+
+# pupil offset (-1..1 across the eye region) beyond which the user is
+# looking past the screen
+GAZE_X_LIMIT = 0.35
+GAZE_Y_LIMIT = 0.45
+
+
+def eye_regions(face_rect):
+    """(x, y, w, h) of the left and right eye regions inside a face box."""
+    x, y, w, h = face_rect
+    ew, eh = int(w * EYE_WIDTH), int(w * EYE_HEIGHT)
+    top = y + int(h * EYE_TOP)
+    side = int(w * EYE_SIDE)
+    return [(x + side, top, ew, eh), (x + w - side - ew, top, ew, eh)]
+
+
+def find_pupil(eye_gray):
+    """
+    Pupil center in an eye image by means of gradients.
+
+    The pupil is the point that the most image gradients point away from:
+    for every candidate center c this scores the mean squared dot product
+    between the unit displacement to each strong-gradient pixel and that
+    pixel's unit gradient, weighted by how dark c is. All candidates are
+    scored at once with NumPy broadcasting on a PUPIL_ROI_WIDTH-wide copy.
+    Returns (x, y, contrast) in eye_gray coordinates, or None.
+    """
+    h, w = eye_gray.shape[:2]
+    if w < 8 or h < 8:
+        return None
+    scale = PUPIL_ROI_WIDTH / w
+    small = cv2.resize(eye_gray, (PUPIL_ROI_WIDTH, max(8, int(round(h * scale)))),
+                       interpolation=cv2.INTER_AREA).astype(np.float32)
+
+    gy, gx = np.gradient(small)
+    magnitude = np.hypot(gx, gy)
+    threshold = magnitude.mean() + GRADIENT_THRESHOLD * magnitude.std()
+    ys, xs = np.nonzero(magnitude > threshold)
+    if len(xs) < 10:
+        return None
+    gx = gx[ys, xs] / magnitude[ys, xs]
+    gy = gy[ys, xs] / magnitude[ys, xs]
+    xs = xs.astype(np.float32)
+    ys = ys.astype(np.float32)
+
+    sh, sw = small.shape
+    cy, cx = np.mgrid[0:sh, 0:sw]
+    cx = cx.reshape(-1, 1).astype(np.float32)
+    cy = cy.reshape(-1, 1).astype(np.float32)
+    dx = xs[None, :] - cx
+    dy = ys[None, :] - cy
+    norm = np.hypot(dx, dy)
+    norm[norm == 0] = np.inf
+    dots = np.maximum((dx * gx + dy * gy) / norm, 0)
+    scores = (dots * dots).mean(axis=1)
+
+    # dark pixels are more likely pupil centers
+    weight = 255 - cv2.GaussianBlur(small, (5, 5), 0)
+    scores = (scores * weight.reshape(-1)).reshape(sh, sw)
+
+    # centers on the region border are eyelids or eyebrows, not pupils
+    scores[[0, -1], :] = 0
+    scores[:, [0, -1]] = 0
+    best = int(np.argmax(scores))
+    mean_score = scores.mean()
+    if mean_score <= 0:
+        return None
+    py, px = divmod(best, sw)
+    return px / scale, py / scale, float(scores.flat[best] / mean_score)
+
+
+def estimate_gaze(gray, face_rect):
+    """
+    Pupil centers and gaze direction for a detected face.
+
+    Returns {'pupils': [(x, y), (x, y)], 'gaze_x', 'gaze_y', 'contrast'}
+    in frame coordinates, where gaze_x/gaze_y are the mean pupil offsets
+    from the eye-region centers (-1..1; negative is image left/up), or None
+    when either pupil can't be found (closed eyes, glare, blur).
+    """
+    pupils, offsets, contrasts = [], [], []
+    for ex, ey, ew, eh in eye_regions(face_rect):
+        roi = gray[max(0, ey):ey + eh, max(0, ex):ex + ew]
+        found = find_pupil(roi)
+        if found is None or found[2] < MIN_PUPIL_CONTRAST:
+            return None
+        px, py, contrast = found
+        pupils.append((int(ex + px), int(ey + py)))
+        offsets.append(((px - ew / 2) / (ew / 2), (py - eh / 2) / (eh / 2)))
+        contrasts.append(contrast)
+    offsets = np.array(offsets)
+    return {
+        'pupils': pupils,
+        'gaze_x': float(offsets[:, 0].mean()),
+        'gaze_y': float(offsets[:, 1].mean()),
+        'contrast': float(min(contrasts)),
+    }
+
+
+def is_looking_at_screen(gaze):
+    return abs(gaze['gaze_x']) <= GAZE_X_LIMIT and abs(gaze['gaze_y']) <= GAZE_Y_LIMIT
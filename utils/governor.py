@@ -0,0 +1,126 @@
+import os
+import time
+import cv2
+from config.settings import load_settings
+
+# Detection quality tiers, most accurate first. "scale" is the input
+# resolution factor (minSize shrinks with it, so the smallest detectable
+# face stays the same); "threads" is a fraction of the CPU cores OpenCV
+# may use.
+TIERS = [
+    {"name": "high", "scale": 1.0, "scale_factor": 1.05, "min_neighbors": 6, "threads": 1.0},
+    {"name": "medium", "scale": 0.75, "scale_factor": 1.1, "min_neighbors": 5, "threads": 0.5},
+    {"name": "low", "scale": 0.5, "scale_factor": 1.15, "min_neighbors": 4, "threads": 0.5},
+    {"name": "minimal", "scale": 0.4, "scale_factor": 1.2, "min_neighbors": 3, "threads": 0.25},
+]
+MIN_FACE_SIZE = 80
+
+DEFAULT_CPU_PERCENT = 15      # of the whole machine
+DEFAULT_LATENCY_MS = 80       # per analyzed frame
+EVALUATE_EVERY = 10           # frames between decisions
+UPGRADE_AFTER = 30            # frames of headroom before trying a better tier
+HEADROOM = 0.5                # "headroom" = below this fraction of both budgets
+EMA_ALPHA = 0.2
+
+
+class DetectionGovernor:
+    """
+    Keeps face detection within a CPU and latency budget.
+
+    Every analyzed frame reports its wall time and the CPU time of the
+    thread that analyzed it (not the whole process, whose audio, watcher
+    and event-log threads have nothing to do with detection). The
+    governor keeps moving averages of latency and CPU share (CPU time per
+    frame x frames per second / cores) and every EVALUATE_EVERY frames
+    steps one tier down when either budget is exceeded, or one tier up
+    after UPGRADE_AFTER frames comfortably under both. Budgets come from
+    settings "detection_cpu_percent" and "detection_latency_ms", so the
+    same build settles on "high" on a workstation and lower on a 2-core
+    laptop.
+    """
+    def __init__(self, cpu_percent=None, latency_ms=None):
+        settings = load_settings()
+        self.cpu_budget = float(cpu_percent or settings.get("detection_cpu_percent", DEFAULT_CPU_PERCENT))
+        self.latency_budget = float(latency_ms or settings.get("detection_latency_ms", DEFAULT_LATENCY_MS)) / 1000
+        self.cores = os.cpu_count() or 1
+        self.tier_index = 0
+        self.latency = None
+        self.cpu_per_frame = None
+        self.frame_rate = None
+        self._last_frame = None
+        self._frames = 0
+        self._headroom_frames = 0
+        self._apply_threads()
+
+    @property
+    def tier(self):
+        return TIERS[self.tier_index]
+
+    def params(self):
+        """detectMultiScale parameters and input scale for the current tier."""
+        tier = self.tier
+        size = max(24, int(MIN_FACE_SIZE * tier["scale"]))
+        return {"scale": tier["scale"], "scaleFactor": tier["scale_factor"],
+                "minNeighbors": tier["min_neighbors"], "minSize": (size, size)}
+
+    def measure(self):
+        """Start timing a frame on the detection thread; pass the result to record()."""
+        return time.perf_counter(), time.thread_time()
+
+    def record(self, started):
+        wall_start, cpu_start = started
+        now = time.perf_counter()
+        latency = now - wall_start
+        cpu = time.thread_time() - cpu_start
+        if self._last_frame is not None and now > self._last_frame:
+            self.frame_rate = self._ema(self.frame_rate, 1.0 / (now - self._last_frame))
+        self._last_frame = now
+        self.latency = self._ema(self.latency, latency)
+        self.cpu_per_frame = self._ema(self.cpu_per_frame, cpu)
+        self._frames += 1
+        if self._frames % EVALUATE_EVERY == 0:
+            self._evaluate()
+
+    def cpu_percent(self):
+        if self.cpu_per_frame is None or self.frame_rate is None:
+            return 0.0
+        return self.cpu_per_frame * self.frame_rate / self.cores * 100
+
+    def _ema(self, current, value):
+        return value if current is None else current + EMA_ALPHA * (value - current)
+
+    def _evaluate(self):
+        cpu = self.cpu_percent()
+        if (self.latency > self.latency_budget or cpu > self.cpu_budget) and self.tier_index < len(TIERS) - 1:
+            self._set_tier(self.tier_index + 1)
+        elif self.latency < self.latency_budget * HEADROOM and cpu < self.cpu_budget * HEADROOM:
+            self._headroom_frames += EVALUATE_EVERY
+            if self._headroom_frames >= UPGRADE_AFTER and self.tier_index > 0:
+                self._set_tier(self.tier_index - 1)
+        else:
+            self._headroom_frames = 0
+
+    def _set_tier(self, index):
+        self.tier_index = index
+        self._headroom_frames = 0
+        # let the averages settle on the new tier before the next decision
+        self.latency = self.cpu_per_frame = None
+        self._apply_threads()
+        print(f"[Camera] Detection quality: {self.tier['name']}")
+
+    def _apply_threads(self):
+        try:
+            cv2.setNumThreads(max(1, int(round(self.cores * self.tier["threads"]))))
+        except Exception:
+            pass
+
+    def report(self):
+        """Current tier and measurements; sampled into diagnostics samples.jsonl."""
+        return {
+            "tier": self.tier["name"],
+            "latency_ms": round((self.latency or 0) * 1000, 1),
+            "cpu_percent": round(self.cpu_percent(), 1),
+            "frame_rate": round(self.frame_rate or 0, 1),
+            "cpu_budget": self.cpu_budget,
+            "latency_budget_ms": self.latency_budget * 1000,
+        }
@@ -1,3 +1,9 @@
+import os
+
+# os.umask() can only be read by setting it, so do it once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 def interpolate_color(c1, c2, t):
     return '#{:02x}{:02x}{:02x}'.format(
         int(c1[0] + (c2[0] - c1[0]) * t),
@@ -7,4 +13,11 @@ def interpolate_color(c1, c2, t):
 
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip("#")
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
\ No newline at end of file
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+def chmod_default(path):
+    """Give a mkstemp() file (always 0600) the mode a plain open() would."""
+    try:
+        os.chmod(path, 0o666 & ~_UMASK)
+    except OSError:
+        pass
@@ -0,0 +1,250 @@
+import threading
+import time
+from collections import namedtuple
+
+# Event kinds
+FACE_LOST = "face_lost"        # no face in view
+LOOKED_AWAY = "looked_away"    # face visible, gaze off the screen
+LOOKED_BACK = "looked_back"    # gaze back on the screen
+LOW_LIGHT = "low_light"        # frame too dark to analyze
+CAMERA_ERROR = "camera_error"  # camera missing or failing
+
+# Stable states, by the event that enters them
+STATE_NO_FACE = FACE_LOST
+STATE_AWAY = LOOKED_AWAY
+STATE_LOOKING = LOOKED_BACK
+STATE_LOW_LIGHT = LOW_LIGHT
+STATE_CAMERA_ERROR = CAMERA_ERROR
+
+# How long a new state must persist before it replaces the stable one
+DEFAULT_DWELL = {
+    STATE_LOOKING: 0.5,
+    STATE_AWAY: 0.3,
+    STATE_NO_FACE: 1.0,
+    STATE_LOW_LIGHT: 1.0,
+    STATE_CAMERA_ERROR: 2.0,
+}
+# samples that must agree as well, so one lucky frame can't flip the state
+MIN_AGREEING_SAMPLES = 2
+# poll slowly while nothing is changing, quickly while a change is pending
+STEADY_INTERVAL = 0.5
+CONFIRM_INTERVAL = 0.1
+
+CAMERA_ERROR_MESSAGES = ("Camera error", "Camera unavailable", "Detection error")
+
+LookEvent = namedtuple("LookEvent", "kind time previous message analysis")
+
+
+def classify(analysis):
+    """Raw state of a single PeekingDetector analysis."""
+    if analysis is None or analysis.get('message') in CAMERA_ERROR_MESSAGES:
+        return STATE_CAMERA_ERROR
+    if analysis.get('is_black'):
+        return STATE_LOW_LIGHT
+    if not analysis.get('face_detected'):
+        return STATE_NO_FACE
+    if analysis.get('peeking'):
+        return STATE_LOOKING
+    return STATE_AWAY
+
+
+class LookAwayMonitor:
+    """
+    Look-away state machine over the peeking detector.
+
+    A background thread samples the camera and turns raw per-frame results
+    into stable states with per-state dwell times (hysteresis), emitting a
+    LookEvent on each change. It samples every STEADY_INTERVAL and only
+    speeds up to CONFIRM_INTERVAL while a change is waiting to be
+    confirmed. Subscribers get events on the monitor thread; UI code should
+    hop to Tk with post_to_ui(). The first state after start() only emits
+    an event if it is a problem or the user is away; being at the screen
+    is the expected starting point.
+    """
+    def __init__(self, source=None, dwell=None):
+        self.source = source
+        self.dwell = dict(DEFAULT_DWELL, **(dwell or {}))
+        self.state = None
+        self.since = None
+        self._latest = None
+        self._candidate = None
+        self._candidate_since = None
+        self._candidate_count = 0
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # --- lifecycle ---
+    def start(self):
+        with self._lock:
+            thread = self._thread
+            if thread is not None and thread.is_alive() and not self._stop.is_set():
+                return
+        if thread is not None:
+            # a stop() is still winding down; let it finish first
+            thread.join(2.0)
+        with self._lock:
+            self.state = None
+            self._latest = None
+            self._candidate = None
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _sample(self):
+        if self.source is None:
+            from utils.camera import is_user_peeking
+            self.source = is_user_peeking
+        try:
+            _, analysis = self.source()
+        except Exception as e:
+            print(f"[Camera] Look-away monitor error: {e}")
+            analysis = None
+        return analysis
+
+    def _run(self):
+        while not self._stop.is_set():
+            analysis = self._sample()
+            self._latest = analysis
+            self.feed(analysis)
+            self._stop.wait(CONFIRM_INTERVAL if self._candidate else STEADY_INTERVAL)
+
+    # --- state machine ---
+    def feed(self, analysis, now=None):
+        """Advance the state machine with one analysis; returns the event emitted, if any."""
+        now = now if now is not None else time.time()
+        raw = classify(analysis)
+        if raw == self.state:
+            self._candidate = None
+            return None
+        if raw != self._candidate:
+            self._candidate, self._candidate_since, self._candidate_count = raw, now, 0
+        self._candidate_count += 1
+        if (now - self._candidate_since < self.dwell[raw]
+                or self._candidate_count < MIN_AGREEING_SAMPLES):
+            return None
+
+        previous, self.state, self.since = self.state, raw, self._candidate_since
+        self._candidate = None
+        if previous is None and raw == STATE_LOOKING:
+            return None
+        event = LookEvent(raw, self.since, previous,
+                          analysis.get('message') if analysis else "Camera unavailable", analysis)
+        self._emit(event)
+        return event
+
+    def latest(self):
+        """Most recent raw analysis (for the camera preview)."""
+        return self._latest
+
+    # --- subscribers ---
+    def subscribe(self, callback):
+        """Call callback(event) for every event; returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def _emit(self, event):
+        with self._lock:
+            callbacks = list(self._subscribers)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Look-away subscriber error ({event.kind}): {e}")
+
+    def events(self):
+        """Async iterator of events; see _EventStream for how to close it."""
+        return _EventStream(self)
+
+
+class _EventStream:
+    """
+    Async iterator over a monitor's events.
+
+    Use it as `async with monitor.events() as events: async for event in
+    events: ...` so the subscription ends when the block exits; a
+    cancelled iteration also unsubscribes. The subscriber only holds a
+    weak reference to the stream and drops itself when the stream is gone
+    or its event loop is closed, so an abandoned stream can't leak or
+    raise from the monitor thread.
+    """
+    def __init__(self, monitor):
+        self.monitor = monitor
+        self.queue = None
+        self.unsubscribe = None
+        self.closed = False
+
+    def _subscribe(self):
+        if self.unsubscribe is not None or self.closed:
+            return
+        import asyncio
+        import weakref
+        loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        ref = weakref.ref(self)
+        unsubscribe = None
+
+        def deliver(event):
+            stream = ref()
+            if stream is None or stream.closed:
+                unsubscribe()
+                return
+            try:
+                loop.call_soon_threadsafe(stream.queue.put_nowait, event)
+            except RuntimeError:
+                # the consumer's loop is closed
+                stream.close()
+
+        unsubscribe = self.monitor.subscribe(deliver)
+        self.unsubscribe = unsubscribe
+
+    def __aiter__(self):
+        self._subscribe()
+        return self
+
+    async def __anext__(self):
+        if self.closed:
+            raise StopAsyncIteration
+        self._subscribe()
+        try:
+            return await self.queue.get()
+        except BaseException:
+            # cancelled (or the loop is shutting down): stop listening
+            self.close()
+            raise
+
+    async def __aenter__(self):
+        self._subscribe()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    async def aclose(self):
+        self.close()
+
+    def close(self):
+        self.closed = True
+        if self.unsubscribe:
+            self.unsubscribe()
+            self.unsubscribe = None
+
+
+# Global monitor instance
+look_monitor = None
+
+def get_look_monitor():
+    global look_monitor
+    if look_monitor is None:
+        look_monitor = LookAwayMonitor()
+    return look_monitor
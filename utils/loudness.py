@@ -0,0 +1,51 @@
+import numpy as np
+from utils.pcm import WavReader
+
+ANALYSIS_BLOCK_FRAMES = 64 * 1024
+WINDOW_SECONDS = 0.1
+SILENCE_GATE_DBFS = -60.0   # windows quieter than this don't count towards loudness
+TARGET_RMS_DBFS = -20.0
+MIN_GAIN = 0.1
+
+
+def _to_db(value):
+    return float(20 * np.log10(max(value, 1e-9)))
+
+
+def analyze_loudness(path):
+    """
+    Measure a WAV's loudness in one streaming pass.
+
+    Samples are read in blocks and split into 100 ms windows; RMS is taken
+    over the non-silent windows only, so the gaps in a beeping alarm don't
+    make it look quieter than it sounds. Returns rms/peak in dBFS and the
+    playback gain that brings the sound to TARGET_RMS_DBFS.
+    """
+    with WavReader(path) as reader:
+        window = max(1, int(reader.framerate * WINDOW_SECONDS))
+        block = max(window, ANALYSIS_BLOCK_FRAMES // window * window)
+        energy_sum = 0.0
+        counted = 0
+        peak = 0.0
+        gate = 10 ** (SILENCE_GATE_DBFS / 10)
+        while reader.tell() < reader.nframes:
+            samples = reader.read_float(block)
+            if not len(samples):
+                break
+            peak = max(peak, float(np.abs(samples).max()))
+            mono_sq = np.square(samples, dtype=np.float64).mean(axis=1)
+            usable = len(mono_sq) // window * window
+            if usable:
+                windows = mono_sq[:usable].reshape(-1, window).mean(axis=1)
+            else:
+                windows = mono_sq.mean(keepdims=True)
+            loud = windows[windows > gate]
+            energy_sum += float(loud.sum()) * window
+            counted += len(loud) * window
+
+    rms = np.sqrt(energy_sum / counted) if counted else 0.0
+    rms_db = _to_db(rms)
+    gain = 10 ** ((TARGET_RMS_DBFS - rms_db) / 20) if counted else 1.0
+    # the mixer can only attenuate, so quiet sounds just play at full volume
+    gain = float(min(1.0, max(MIN_GAIN, gain)))
+    return {"rms_db": round(rms_db, 2), "peak_db": round(_to_db(peak), 2), "gain": round(gain, 4)}
@@ -0,0 +1,220 @@
+import struct
+import numpy as np
+from utils.audio_service import DEFAULT_MIXER_FORMAT, get_audio_service
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def mixer_format():
+    """Return (frequency, format, channels) the mixer runs, or will run, at."""
+    try:
+        return get_audio_service().mixer_format()
+    except Exception:
+        return DEFAULT_MIXER_FORMAT
+
+
+# -------------------------
+# WAV header / reader
+# -------------------------
+def read_wav_header(path):
+    """
+    Parse the RIFF header of a WAV file without reading any sample data.
+
+    Unlike the wave module this also accepts WAVE_FORMAT_EXTENSIBLE and
+    float files, which are common for downloaded sounds.
+    """
+    with open(path, "rb") as f:
+        head = f.read(12)
+        if len(head) < 12:
+            raise ValueError("not a WAV file")
+        riff, _, wave_id = struct.unpack("<4sI4s", head)
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            raise ValueError("not a WAV file")
+        header = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                raise ValueError("no data chunk")
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk)
+            if chunk_id == b"fmt ":
+                fmt = f.read(chunk_size)
+                format_tag, channels, rate, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+                if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                    format_tag = struct.unpack("<H", fmt[24:26])[0]
+                header = {
+                    "format_tag": format_tag,
+                    "channels": channels,
+                    "sample_rate": rate,
+                    "sampwidth": (bits + 7) // 8,
+                    "block_align": block_align,
+                }
+                if chunk_size % 2:
+                    f.seek(1, 1)
+            elif chunk_id == b"data":
+                if header is None:
+                    raise ValueError("data chunk before fmt chunk")
+                if header["format_tag"] not in (WAVE_FORMAT_PCM, WAVE_FORMAT_IEEE_FLOAT):
+                    raise ValueError(f"unsupported WAV encoding {header['format_tag']:#x}")
+                header["data_offset"] = f.tell()
+                header["nframes"] = chunk_size // header["block_align"]
+                return header
+            else:
+                f.seek(chunk_size + (chunk_size % 2), 1)
+
+
+class WavReader:
+    """Sequential/seekable frame reader over a WAV file's data chunk."""
+    def __init__(self, path):
+        self.path = path
+        self.header = read_wav_header(path)
+        self.channels = self.header["channels"]
+        self.sampwidth = self.header["sampwidth"]
+        self.framerate = self.header["sample_rate"]
+        self.nframes = self.header["nframes"]
+        self._file = open(path, "rb")
+        self.setpos(0)
+
+    def setpos(self, frame):
+        self._pos = max(0, min(frame, self.nframes))
+        self._file.seek(self.header["data_offset"] + self._pos * self.header["block_align"])
+
+    def tell(self):
+        return self._pos
+
+    def readframes(self, n):
+        n = max(0, min(n, self.nframes - self._pos))
+        data = self._file.read(n * self.header["block_align"])
+        self._pos += len(data) // self.header["block_align"]
+        return data
+
+    def read_float(self, n):
+        """Read up to n frames as a float32 (frames, channels) array."""
+        return frames_to_float(self.readframes(n), self.sampwidth, self.channels,
+                               self.header["format_tag"])
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -------------------------
+# Sample conversion
+# -------------------------
+def frames_to_float(data, sampwidth, channels, format_tag=WAVE_FORMAT_PCM):
+    """Decode interleaved frames into a float32 (frames, channels) array in [-1, 1]."""
+    if format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        dtype = "<f4" if sampwidth == 4 else "<f8"
+        samples = np.frombuffer(data, dtype=dtype).astype(np.float32)
+    elif sampwidth == 1:
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif sampwidth == 2:
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768
+    elif sampwidth == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        ints = (raw[:, 0].astype(np.int32) | (raw[:, 1].astype(np.int32) << 8)
+                | (raw[:, 2].astype(np.int32) << 16))
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 8388608
+    elif sampwidth == 4:
+        samples = np.frombuffer(data, dtype="<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"unsupported sample width {sampwidth}")
+    return samples.reshape(-1, channels)
+
+
+def float_to_frames(samples, sampwidth):
+    """Encode a float (frames, channels) array as interleaved integer PCM."""
+    samples = np.clip(samples, -1.0, 1.0)
+    if sampwidth == 1:
+        return (samples * 127 + 128).astype(np.uint8).tobytes()
+    if sampwidth == 2:
+        return (samples * 32767).astype("<i2").tobytes()
+    if sampwidth == 3:
+        ints = (samples * 8388607).astype("<i4").reshape(-1, 1).view(np.uint8)
+        return ints[:, :3].tobytes()
+    if sampwidth == 4:
+        return (samples * 2147483647).astype("<i4").tobytes()
+    raise ValueError(f"unsupported sample width {sampwidth}")
+
+
+def float_to_mixer_array(samples, fmt):
+    """Convert a float array to the numpy dtype of a pygame mixer format (-16, 16, -8, 8, 32)."""
+    samples = np.clip(samples, -1.0, 1.0)
+    if fmt == -16:
+        return (samples * 32767).astype("<i2")
+    if fmt == 16:
+        return (samples * 32767 + 32768).astype("<u2")
+    if fmt == -8:
+        return (samples * 127).astype(np.int8)
+    if fmt == 8:
+        return (samples * 127 + 128).astype(np.uint8)
+    if fmt == 32:
+        return samples.astype("<f4")
+    raise ValueError(f"unsupported mixer format {fmt}")
+
+
+def float_to_mixer(samples, fmt):
+    """Encode a float array as raw bytes in a pygame mixer format."""
+    return float_to_mixer_array(samples, fmt).tobytes()
+
+
+def convert_channels(samples, channels):
+    """Up- or down-mix a (frames, n) array to the given channel count."""
+    current = samples.shape[1]
+    if current == channels:
+        return samples
+    if channels == 1:
+        return samples.mean(axis=1, keepdims=True)
+    if current == 1:
+        return np.repeat(samples, channels, axis=1)
+    if current > channels:
+        return samples[:, :channels]
+    return np.concatenate([samples, np.repeat(samples[:, -1:], channels - current, axis=1)], axis=1)
+
+
+class StreamResampler:
+    """
+    Linear-interpolation resampler for audio processed in consecutive chunks.
+
+    The last input frame and the fractional read position are carried over
+    between calls so chunk boundaries don't click.
+    """
+    def __init__(self, src_rate, dst_rate):
+        self.step = src_rate / dst_rate
+        self._tail = None
+        self._pos = 0.0
+
+    def process(self, samples):
+        if self.step == 1.0:
+            return samples
+        if self._tail is not None:
+            samples = np.concatenate([self._tail, samples])
+        n = len(samples)
+        if n < 2:
+            self._tail = samples
+            return samples[:0]
+        positions = np.arange(self._pos, n - 1, self.step)
+        idx = positions.astype(np.int64)
+        frac = (positions - idx)[:, None].astype(np.float32)
+        out = samples[idx] * (1 - frac) + samples[idx + 1] * frac
+        next_pos = positions[-1] + self.step if len(positions) else self._pos
+        self._tail = samples[-1:]
+        self._pos = next_pos - (n - 1)
+        return out
+
+
+class FormatConverter:
+    """Convert float chunks from one (rate, channels) layout to another."""
+    def __init__(self, src_rate, src_channels, dst_rate, dst_channels):
+        self.dst_channels = dst_channels
+        self.resampler = StreamResampler(src_rate, dst_rate)
+
+    def process(self, samples):
+        return self.resampler.process(convert_channels(samples, self.dst_channels))
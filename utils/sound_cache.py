@@ -0,0 +1,108 @@
+import os
+import threading
+from collections import OrderedDict
+from config.settings import load_settings
+from utils.audio_service import get_audio_service
+
+DEFAULT_BUDGET_MB = 32
+AUDIO_READY_TIMEOUT = 10
+
+
+def _sound_nbytes(sound):
+    """Approximate decoded size of a Sound in the mixer's native format."""
+    import pygame
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    freq, fmt, channels = init
+    return int(sound.get_length() * freq * channels * (abs(fmt) // 8))
+
+
+class SoundCache:
+    """
+    LRU cache of decoded pygame Sounds.
+
+    Each file is decoded once into a mixer-ready Sound. Entries are keyed by
+    path and validated against the file's mtime, so an edited file is decoded
+    again while repeated plays of an unchanged one cost no decoding.
+    """
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_MB * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()  # path -> (mtime, sound, nbytes)
+        self._used_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return a decoded Sound for path, decoding it on first use."""
+        path = os.path.abspath(path)
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == mtime:
+                self._entries.move_to_end(path)
+                return entry[1]
+
+        if not get_audio_service().ready_for_playback(AUDIO_READY_TIMEOUT):
+            raise RuntimeError("Audio device not ready")
+        import pygame
+        sound = pygame.mixer.Sound(path)
+        nbytes = _sound_nbytes(sound)
+
+        with self._lock:
+            self._discard(path)
+            # a sound larger than the whole budget is handed out uncached
+            if nbytes <= self.budget_bytes:
+                self._entries[path] = (mtime, sound, nbytes)
+                self._used_bytes += nbytes
+                self._evict()
+        return sound
+
+    def preload(self, paths):
+        """Decode paths ahead of time, ignoring missing or broken files."""
+        for path in paths:
+            try:
+                self.get(path)
+            except Exception as e:
+                print(f"Sound preload error ({path}): {e}")
+
+    def set_budget(self, budget_bytes):
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._used_bytes = 0
+
+    @property
+    def used_bytes(self):
+        return self._used_bytes
+
+    def _discard(self, path):
+        entry = self._entries.pop(path, None)
+        if entry:
+            self._used_bytes -= entry[2]
+
+    def _evict(self):
+        while self._used_bytes > self.budget_bytes and self._entries:
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self._used_bytes -= nbytes
+
+
+# Global cache instance
+sound_cache = None
+
+def get_sound_cache():
+    global sound_cache
+    if sound_cache is None:
+        try:
+            budget_mb = float(load_settings().get("sound_cache_mb", DEFAULT_BUDGET_MB))
+        except Exception:
+            budget_mb = DEFAULT_BUDGET_MB
+        sound_cache = SoundCache(int(budget_mb * 1024 * 1024))
+    return sound_cache
+
+def get_sound(path):
+    """Shortcut for get_sound_cache().get(path)."""
+    return get_sound_cache().get(path)
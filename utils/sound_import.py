@@ -0,0 +1,112 @@
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import wave
+from config.paths import USER_SOUNDS_DIR
+from utils.pcm import (WavReader, WAVE_FORMAT_PCM, FormatConverter, float_to_frames,
+                       mixer_format, read_wav_header)
+from utils.sound_library import get_sound_library
+from utils.helpers import chmod_default
+
+IMPORT_CHUNK_FRAMES = 64 * 1024
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def _target_layout():
+    """(rate, sampwidth, channels) that the mixer plays without conversion."""
+    rate, fmt, channels = mixer_format()
+    # the wave module can only write integer PCM; 16-bit is the closest to a float mixer
+    sampwidth = abs(fmt) // 8 if abs(fmt) in (8, 16) else 2
+    return rate, sampwidth, channels
+
+
+def _is_native(header, rate, sampwidth, channels):
+    return (header["format_tag"] == WAVE_FORMAT_PCM and header["sample_rate"] == rate
+            and header["sampwidth"] == sampwidth and header["channels"] == channels)
+
+
+def convert_to_mixer_format(src_path, dest_path):
+    """
+    Stream src_path into dest_path in the mixer's native layout.
+
+    Files that already match are copied as-is; everything else is decoded,
+    channel-mixed and resampled chunk by chunk. The result is written to a
+    temp file and renamed into place, so dest_path is never half-written.
+    """
+    header = read_wav_header(src_path)  # raises ValueError for non-WAV input
+    rate, sampwidth, channels = _target_layout()
+    dest_dir = os.path.dirname(dest_path)
+    os.makedirs(dest_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=dest_dir)
+    try:
+        if _is_native(header, rate, sampwidth, channels):
+            with open(src_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                shutil.copyfileobj(src, dst, COPY_CHUNK_BYTES)
+        else:
+            os.close(fd)
+            with WavReader(src_path) as reader, wave.open(tmp_path, "wb") as out:
+                out.setnchannels(channels)
+                out.setsampwidth(sampwidth)
+                out.setframerate(rate)
+                converter = FormatConverter(reader.framerate, reader.channels, rate, channels)
+                while reader.tell() < reader.nframes:
+                    samples = converter.process(reader.read_float(IMPORT_CHUNK_FRAMES))
+                    out.writeframes(float_to_frames(samples, sampwidth))
+        chmod_default(tmp_path)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return dest_path
+
+
+class SoundImporter:
+    """
+    Background worker that imports uploaded sounds one at a time.
+
+    on_done(name, error) is called from the worker thread once the file is
+    in USER_SOUNDS_DIR and indexed; callers marshal it back to the UI thread.
+    """
+    def __init__(self, dest_dir=USER_SOUNDS_DIR):
+        self.dest_dir = dest_dir
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, src_path, on_done=None):
+        self._jobs.put((src_path, on_done))
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            src_path, on_done = self._jobs.get()
+            name = os.path.basename(src_path)
+            error = None
+            try:
+                dest_path = convert_to_mixer_format(src_path, os.path.join(self.dest_dir, name))
+                # loudness is analyzed once here, never at playback
+                get_sound_library().gain(dest_path)
+            except Exception as e:
+                print("Sound import error:", e)
+                error = e
+            if on_done:
+                try:
+                    on_done(name, error)
+                except Exception as e:
+                    print("Sound import callback error:", e)
+
+
+# Global importer instance
+sound_importer = None
+
+def import_sound(src_path, on_done=None):
+    global sound_importer
+    if sound_importer is None:
+        sound_importer = SoundImporter()
+    sound_importer.submit(src_path, on_done)
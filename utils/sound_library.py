@@ -0,0 +1,221 @@
+import json
+import os
+import threading
+from config.paths import resource_path, user_data_dir, SOUNDS_DIR, USER_SOUNDS_DIR, SOUND_LIBRARY_PATH
+
+LIBRARY_VERSION = 1
+LIBRARY_DIRS = [SOUNDS_DIR, USER_SOUNDS_DIR]
+
+
+def probe_sound(path):
+    """Read a sound's metadata from its WAV header, without decoding samples."""
+    st = os.stat(path)
+    meta = {"size": st.st_size, "mtime": st.st_mtime}
+    try:
+        from utils.pcm import read_wav_header
+        header = read_wav_header(path)
+        meta.update({
+            "duration": header["nframes"] / header["sample_rate"],
+            "sample_rate": header["sample_rate"],
+            "channels": header["channels"],
+            "sampwidth": header["sampwidth"],
+            "format_tag": header["format_tag"],
+        })
+    except Exception:
+        # not a plain WAV: decode once with pydub, the result is still cached
+        try:
+            from pydub import AudioSegment
+            audio = AudioSegment.from_file(path)
+            meta.update({
+                "duration": len(audio) / 1000,
+                "sample_rate": audio.frame_rate,
+                "channels": audio.channels,
+                "sampwidth": audio.sample_width,
+                "format_tag": None,
+            })
+        except Exception:
+            meta.update({"duration": 0, "sample_rate": 0, "channels": 0,
+                         "sampwidth": 0, "format_tag": None})
+    return meta
+
+
+class SoundLibrary:
+    """
+    Persistent index of sound file metadata.
+
+    Entries are keyed by their path relative to the app's resource folder
+    (bundled sounds) or, prefixed with "data:", to the per-user data folder
+    (imported sounds; the same folder when running from source), and are
+    only re-probed when a file's size or mtime changes, so listing or
+    inspecting a large library costs a stat per file at most.
+    """
+    def __init__(self, index_path=SOUND_LIBRARY_PATH, directories=LIBRARY_DIRS):
+        self.index_path = index_path
+        self.directories = directories
+        self.entries = {}
+        base = os.path.abspath(resource_path(""))
+        data = os.path.abspath(user_data_dir())
+        # most specific root first
+        self._roots = [("", base)] if data == base else [("data:", data), ("", base)]
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._analyzing = False
+        self._analysis_callbacks = []
+        self._load()
+
+    def _key(self, path):
+        path = os.path.abspath(path)
+        for prefix, root in self._roots:
+            if path == root or path.startswith(root.rstrip(os.sep) + os.sep):
+                return prefix + os.path.relpath(path, root).replace(os.sep, "/")
+        return path.replace(os.sep, "/")
+
+    def _path(self, key):
+        """Inverse of _key()."""
+        for prefix, root in self._roots:
+            if prefix and key.startswith(prefix):
+                return os.path.join(root, key[len(prefix):])
+        return os.path.join(self._roots[-1][1], key)
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == LIBRARY_VERSION:
+                self.entries = data.get("entries", {})
+        except Exception:
+            self.entries = {}
+
+    def save(self):
+        """Write the index atomically if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            text = json.dumps({"version": LIBRARY_VERSION, "entries": self.entries}, indent=2)
+            self._dirty = False
+            tmp_path = self.index_path + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    f.write(text)
+                os.replace(tmp_path, self.index_path)
+            except Exception as e:
+                print("Sound library save error:", e)
+
+    def _refresh(self, path, st):
+        key = self._key(path)
+        entry = self.entries.get(key)
+        if entry and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            return entry
+        entry = probe_sound(path)
+        self.entries[key] = entry
+        self._dirty = True
+        return entry
+
+    def scan(self):
+        """Incrementally rescan the library folders; only changed files are probed."""
+        with self._lock:
+            seen = set()
+            for directory in self.directories:
+                if not os.path.isdir(directory):
+                    continue
+                for item in os.scandir(directory):
+                    if not item.is_file() or not item.name.lower().endswith(".wav"):
+                        continue
+                    seen.add(self._key(item.path))
+                    self._refresh(item.path, item.stat())
+            for key in list(self.entries):
+                if key not in seen and not os.path.exists(self._path(key)):
+                    del self.entries[key]
+                    self._dirty = True
+        self.save()
+
+    def info(self, path):
+        """Metadata for one file, probing it only if it is new or changed."""
+        with self._lock:
+            entry = self._refresh(path, os.stat(path))
+        self.save()
+        return entry
+
+    def gain(self, path):
+        """
+        Playback gain for path from its stored loudness analysis.
+
+        The analysis runs once per file version and is persisted with the
+        rest of the metadata, so playback never processes the signal.
+        """
+        with self._lock:
+            entry = self._refresh(path, os.stat(path))
+            if "gain" in entry:
+                return entry["gain"]
+        # analyze outside the lock so UI-side lookups aren't held up
+        analysis = self._analyze(path, entry)
+        with self._lock:
+            entry.update(analysis)
+            self._dirty = True
+        self.save()
+        return analysis["gain"]
+
+    def analyze_pending(self):
+        """Run the loudness analysis for every indexed file that lacks one."""
+        for key in list(self.entries):
+            entry = self.entries.get(key)
+            if entry is not None and "gain" not in entry:
+                try:
+                    self.gain(self._path(key))
+                except Exception as e:
+                    print(f"Loudness analysis error ({key}): {e}")
+
+    def analyze_pending_async(self, on_done=None):
+        """
+        analyze_pending() on a background thread, one run at a time: while
+        a run is going, further calls just add on_done, which is called on
+        that thread when it finishes.
+        """
+        with self._lock:
+            if on_done is not None:
+                self._analysis_callbacks.append(on_done)
+            if self._analyzing:
+                return
+            self._analyzing = True
+        threading.Thread(target=self._analyze_all, daemon=True).start()
+
+    def _analyze_all(self):
+        try:
+            self.analyze_pending()
+        finally:
+            with self._lock:
+                self._analyzing = False
+                callbacks, self._analysis_callbacks = self._analysis_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print("Sound analysis callback error:", e)
+
+    def _analyze(self, path, entry):
+        if entry.get("format_tag") is None:
+            return {"rms_db": None, "peak_db": None, "gain": 1.0}
+        from utils.loudness import analyze_loudness
+        return analyze_loudness(path)
+
+    def cached(self, path):
+        """Indexed metadata for path, or None; never touches the file."""
+        with self._lock:
+            return self.entries.get(self._key(path))
+
+    def names(self, directory=USER_SOUNDS_DIR):
+        """File names indexed in a directory (call scan() to pick up new files)."""
+        prefix = self._key(directory) + "/"
+        with self._lock:
+            return sorted(key[len(prefix):] for key in self.entries
+                          if key.startswith(prefix) and "/" not in key[len(prefix):])
+
+
+# Global library instance
+sound_library = None
+
+def get_sound_library():
+    global sound_library
+    if sound_library is None:
+        sound_library = SoundLibrary()
+    return sound_library
@@ -1,26 +1,102 @@
 import os
-from pydub import AudioSegment
+import tempfile
+import wave
+import numpy as np
+from config.paths import USER_SOUNDS_DIR
+from utils.pcm import WavReader, WAVE_FORMAT_IEEE_FLOAT, frames_to_float, float_to_frames
+from utils.sound_library import get_sound_library
+from utils.helpers import chmod_default
+
+TRIM_CHUNK_FRAMES = 64 * 1024
+TRIM_FADE_SECONDS = 0.02
 
 def list_user_sounds():
-    path = "sounds/user"
-    return [f for f in os.listdir(path) if f.endswith(".wav")]
+    library = get_sound_library()
+    library.scan()
+    return library.names(USER_SOUNDS_DIR)
 
 def get_audio_duration(filepath):
     try:
-        audio = AudioSegment.from_file(filepath)
-        return len(audio) / 1000  # seconds
+        return get_sound_library().info(filepath)["duration"]  # seconds
     except:
         return 0
 
-def trim_audio(filepath, start_sec, duration_sec=60):
+def trim_audio(filepath, start_sec, duration_sec=60, fade_sec=TRIM_FADE_SECONDS):
+    """
+    Copy [start_sec, start_sec + duration_sec) of a sound into USER_SOUNDS_DIR.
+
+    WAV input is streamed chunk by chunk, so memory stays at a few chunks
+    whatever the recording's length; other formats fall back to pydub.
+    """
     try:
-        audio = AudioSegment.from_file(filepath)
-        end = start_sec * 1000 + duration_sec * 1000
-        trimmed = audio[start_sec * 1000:end]
-        filename = os.path.basename(filepath)
-        dest_path = os.path.join("sounds/user", filename)
-        trimmed.export(dest_path, format="wav")
+        try:
+            reader = WavReader(filepath)
+        except ValueError:
+            return _trim_with_pydub(filepath, start_sec, duration_sec)
+        with reader:
+            _stream_trim(reader, start_sec, duration_sec, fade_sec)
         return True
     except Exception as e:
         print("Trimming error:", e)
         return False
+
+def _stream_trim(reader, start_sec, duration_sec, fade_sec):
+    rate = reader.framerate
+    start = int(start_sec * rate)
+    total = min(reader.nframes - start, int(duration_sec * rate))
+    if total <= 0:
+        raise ValueError("trim range is outside the sound")
+    fade = min(int(fade_sec * rate), total // 2)
+    is_float = reader.header["format_tag"] == WAVE_FORMAT_IEEE_FLOAT
+    # the wave module only writes integer PCM; float input becomes 16-bit
+    out_width = 2 if is_float else reader.sampwidth
+
+    os.makedirs(USER_SOUNDS_DIR, exist_ok=True)
+    dest_path = os.path.join(USER_SOUNDS_DIR, os.path.basename(reader.path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=USER_SOUNDS_DIR)
+    os.close(fd)
+    try:
+        with wave.open(tmp_path, "wb") as out:
+            out.setnchannels(reader.channels)
+            out.setsampwidth(out_width)
+            out.setframerate(rate)
+            reader.setpos(start)
+            pos = 0
+            while pos < total:
+                n = min(TRIM_CHUNK_FRAMES, total - pos)
+                data = reader.readframes(n)
+                # only the boundary chunks are decoded, for the fades
+                if is_float or pos < fade or pos + n > total - fade:
+                    samples = _reader_frames_to_float(reader, data)
+                    samples = _apply_fades(samples, pos, total, fade)
+                    data = float_to_frames(samples, out_width)
+                out.writeframes(data)
+                pos += n
+        chmod_default(tmp_path)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def _reader_frames_to_float(reader, data):
+    return frames_to_float(data, reader.sampwidth, reader.channels, reader.header["format_tag"])
+
+def _apply_fades(samples, pos, total, fade):
+    if fade <= 0:
+        return samples
+    idx = pos + np.arange(len(samples))
+    gain = np.minimum(np.minimum(idx / fade, (total - 1 - idx) / fade), 1.0)
+    return samples * np.clip(gain, 0.0, 1.0)[:, None].astype(np.float32)
+
+def _trim_with_pydub(filepath, start_sec, duration_sec):
+    from pydub import AudioSegment
+    audio = AudioSegment.from_file(filepath)
+    end = start_sec * 1000 + duration_sec * 1000
+    trimmed = audio[start_sec * 1000:end]
+    filename = os.path.basename(filepath)
+    os.makedirs(USER_SOUNDS_DIR, exist_ok=True)
+    dest_path = os.path.join(USER_SOUNDS_DIR, filename)
+    tmp_path = dest_path + ".tmp"
+    trimmed.export(tmp_path, format="wav")
+    os.replace(tmp_path, dest_path)
+    return True
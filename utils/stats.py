@@ -0,0 +1,96 @@
+import time
+import numpy as np
+from utils.event_log import get_event_log, ROLLUP_COLUMNS
+
+
+def load_daily(first_day=None, last_day=None, event_log=None):
+    """
+    Daily rollups between two 'YYYY-MM-DD' days (inclusive) as NumPy arrays.
+
+    Returns {"day": datetime64[D] array, <counter>: array, ...}.
+    """
+    event_log = event_log or get_event_log()
+    rows = event_log.query(
+        f"SELECT day, {', '.join(ROLLUP_COLUMNS)} FROM rollup_daily "
+        "WHERE day >= ? AND day <= ? ORDER BY day",
+        (first_day or "0000-00-00", last_day or "9999-99-99"))
+    return _columns(rows, np.array([r[0] for r in rows], dtype="datetime64[D]"))
+
+
+def load_hourly(start_ts=0, end_ts=None, event_log=None):
+    """Hourly rollups with start_ts <= hour < end_ts; "hour" is epoch seconds."""
+    event_log = event_log or get_event_log()
+    rows = event_log.query(
+        f"SELECT hour, {', '.join(ROLLUP_COLUMNS)} FROM rollup_hourly "
+        "WHERE hour >= ? AND hour < ? ORDER BY hour",
+        (int(start_ts), int(end_ts if end_ts is not None else time.time() + 3600)))
+    return _columns(rows, np.array([r[0] for r in rows], dtype=np.int64))
+
+
+def _columns(rows, keys):
+    values = np.array([r[1:] for r in rows], dtype=np.float64).reshape(len(rows), len(ROLLUP_COLUMNS))
+    data = {name: values[:, i] for i, name in enumerate(ROLLUP_COLUMNS)}
+    data["day" if keys.dtype.kind == "M" else "hour"] = keys
+    return data
+
+
+def summarize(data, mask=None):
+    """Totals and derived rates for all rows (or those selected by mask)."""
+    totals = {name: float(data[name][mask].sum() if mask is not None else data[name].sum())
+              for name in ROLLUP_COLUMNS}
+    totals["compliance"] = totals["completed"] / totals["alarms"] if totals["alarms"] else None
+    totals["mean_latency"] = (totals["latency_sum"] / totals["latency_count"]
+                              if totals["latency_count"] else None)
+    totals["resets_per_break"] = totals["resets"] / totals["started"] if totals["started"] else None
+    return totals
+
+
+def group_sums(keys, data):
+    """Sum every counter per integer group key; returns (unique keys, {counter: sums})."""
+    groups, index = np.unique(keys, return_inverse=True)
+    return groups, {name: np.bincount(index, weights=data[name], minlength=len(groups))
+                    for name in ROLLUP_COLUMNS}
+
+
+def weekly(daily):
+    """Per-week (Monday-based) totals and compliance from daily rollups."""
+    if not len(daily["day"]):
+        return {"week": np.array([], dtype="datetime64[D]"), "compliance": np.array([])}
+    # numpy weeks start on Thursday (1970-01-01); shift so they start on Monday
+    week_start = (daily["day"] - np.timedelta64(4, "D")).astype("datetime64[W]") + np.timedelta64(4, "D")
+    weeks, sums = group_sums(week_start.astype(np.int64), daily)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sums["compliance"] = np.where(sums["alarms"] > 0, sums["completed"] / sums["alarms"], np.nan)
+        sums["mean_latency"] = np.where(sums["latency_count"] > 0,
+                                        sums["latency_sum"] / sums["latency_count"], np.nan)
+    sums["week"] = weeks.astype("datetime64[D]")
+    return sums
+
+
+def hour_of_day_profile(hourly):
+    """Compliance by local hour of day (24 entries, NaN where there were no alarms)."""
+    offset = time.localtime().tm_gmtoff
+    hour_of_day = ((hourly["hour"] + offset) // 3600) % 24
+    alarms = np.bincount(hour_of_day, weights=hourly["alarms"], minlength=24)
+    completed = np.bincount(hour_of_day, weights=hourly["completed"], minlength=24)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(alarms > 0, completed / alarms, np.nan)
+
+
+def overview(today=None, event_log=None):
+    """Everything the stats screen shows, from the rollup tables only."""
+    today = np.datetime64(today or time.strftime("%Y-%m-%d"), "D")
+    daily = load_daily(event_log=event_log)
+    days = daily["day"]
+    periods = {
+        "Today": days == today,
+        "Last 7 days": days > today - np.timedelta64(7, "D"),
+        "Last 30 days": days > today - np.timedelta64(30, "D"),
+        "All time": None,
+    }
+    hourly = load_hourly(start_ts=time.time() - 90 * 86400, event_log=event_log)
+    return {
+        "periods": {name: summarize(daily, mask) for name, mask in periods.items()},
+        "weekly": weekly(daily),
+        "hour_profile": hour_of_day_profile(hourly),
+    }
@@ -0,0 +1,94 @@
+import threading
+import numpy as np
+from utils.audio_service import get_audio_service
+from utils.pcm import float_to_mixer_array, mixer_format
+
+TONE_PREFIX = "tone:"
+TONE_PEAK = 0.5   # about -6 dBFS; keeps tones in line with the loudness target
+AUDIO_READY_TIMEOUT = 10
+
+# Each preset is a list of notes: (start_s, freq_hz, end_freq_hz, duration_s)
+# plus a shared ADSR envelope and the partials that give it its timbre.
+TONE_PRESETS = {
+    "tone:chime": {
+        "label": "Soft Chime",
+        "notes": [(0.0, 880.0, 880.0, 1.4), (0.22, 1318.5, 1318.5, 1.4)],
+        "partials": [(1.0, 1.0), (2.76, 0.35), (5.4, 0.12)],  # bell-like
+        "envelope": {"attack": 0.005, "decay": 1.2, "sustain": 0.0, "release": 0.2},
+    },
+    "tone:beep": {
+        "label": "Triple Beep",
+        "notes": [(0.0, 1000.0, 1000.0, 0.15), (0.25, 1000.0, 1000.0, 0.15), (0.5, 1000.0, 1000.0, 0.15)],
+        "partials": [(1.0, 1.0)],
+        "envelope": {"attack": 0.01, "decay": 0.02, "sustain": 0.8, "release": 0.03},
+    },
+    "tone:rising": {
+        "label": "Gentle Rise",
+        "notes": [(0.0, 440.0, 880.0, 1.8)],
+        "partials": [(1.0, 1.0), (2.0, 0.2)],
+        "envelope": {"attack": 0.4, "decay": 0.2, "sustain": 0.8, "release": 0.4},
+    },
+}
+
+
+def is_tone(name):
+    return isinstance(name, str) and name.startswith(TONE_PREFIX)
+
+
+def tone_label(name):
+    return TONE_PRESETS[name]["label"]
+
+
+def adsr_envelope(n, rate, attack, decay, sustain, release):
+    """Vectorized ADSR gain curve of n samples."""
+    t = np.arange(n) / rate
+    length = n / rate
+    env = np.where(t < attack, t / max(attack, 1e-6),
+                   sustain + (1 - sustain) * np.exp(-3 * (t - attack) / max(decay, 1e-6)))
+    if release > 0:
+        env = env * np.clip((length - t) / release, 0.0, 1.0)
+    return env.astype(np.float32)
+
+
+def render_tone(name, rate):
+    """Render a preset to a mono float32 array in [-TONE_PEAK, TONE_PEAK]."""
+    preset = TONE_PRESETS[name]
+    total = max(start + duration for start, _, _, duration in preset["notes"])
+    out = np.zeros(int(total * rate) + 1, dtype=np.float32)
+    for start, f0, f1, duration in preset["notes"]:
+        n = int(duration * rate)
+        # linear sweep: integrate the instantaneous frequency for the phase
+        freq = np.linspace(f0, f1, n, dtype=np.float64)
+        phase = 2 * np.pi * np.cumsum(freq) / rate
+        note = sum(amp * np.sin(phase * ratio) for ratio, amp in preset["partials"])
+        note = note * adsr_envelope(n, rate, **preset["envelope"])
+        offset = int(start * rate)
+        out[offset:offset + n] += note.astype(np.float32)
+    peak = np.abs(out).max()
+    if peak > 0:
+        out *= TONE_PEAK / peak
+    return out
+
+
+# Rendered tones, keyed by (name, mixer format); each is a few hundred KB at most
+_tone_sounds = {}
+_tone_lock = threading.Lock()
+
+def get_tone_sound(name):
+    """
+    Mixer-ready Sound for a tone preset, rendered once per mixer format.
+    Never waits for the mixer on the Tk thread (raises if it isn't up yet).
+    """
+    if not get_audio_service().ready_for_playback(AUDIO_READY_TIMEOUT):
+        raise RuntimeError("Audio device not ready")
+    import pygame
+    rate, fmt, channels = mixer_format()
+    key = (name, rate, fmt, channels)
+    with _tone_lock:
+        sound = _tone_sounds.get(key)
+        if sound is None:
+            mono = render_tone(name, rate)
+            samples = mono[:, None].repeat(channels, axis=1) if channels > 1 else mono
+            sound = pygame.sndarray.make_sound(np.ascontiguousarray(float_to_mixer_array(samples, fmt)))
+            _tone_sounds[key] = sound
+    return sound
@@ -0,0 +1,114 @@
+import collections
+import threading
+import time
+
+# pump cadence: right away while work is queued; when idle the interval
+# doubles up to IDLE_INTERVAL_MS
+BUSY_INTERVAL_MS = 1
+IDLE_INTERVAL_MS = 40
+# UI-thread time one drain may spend before yielding to Tk events
+DRAIN_BUDGET_MS = 8
+
+
+class UIDispatcher:
+    """
+    The one way for background threads to touch Tk.
+
+    Any thread can post() a callable; an after() pump on the Tk thread runs
+    them in order. post() only appends under a lock, it never calls Tk, so
+    it works however the Tk loop is driven (mainloop() or update()) and
+    never waits on the Tk thread. The pump backs off to IDLE_INTERVAL_MS
+    while nothing is queued. Posts with a key replace a still-queued post
+    with the same key (keeping its place), so e.g. only the newest camera
+    frame is drawn. Each drain stops after DRAIN_BUDGET_MS and leaves the
+    rest for the next pump, so a burst of background work can't freeze the
+    window.
+    """
+    def __init__(self, app, budget_ms=DRAIN_BUDGET_MS):
+        self.app = app
+        self.budget = budget_ms / 1000
+        self._order = collections.deque()
+        self._keyed = {}
+        self._lock = threading.Lock()
+        self._running = False
+        self._interval = BUSY_INTERVAL_MS
+
+    def start(self):
+        """Start the pump; call on the Tk thread."""
+        if not self._running:
+            self._running = True
+            self.app.after(BUSY_INTERVAL_MS, self._pump)
+
+    def post(self, func, *args, key=None):
+        """Run func(*args) on the Tk thread. Thread-safe, never blocks."""
+        with self._lock:
+            if key is None:
+                self._order.append((None, func, args))
+            else:
+                if key not in self._keyed:
+                    self._order.append((key, None, None))
+                self._keyed[key] = (func, args)
+
+    def after(self, ms, func, *args, key=None):
+        """app.after(ms, func, *args), scheduled from any thread."""
+        self.post(lambda: self.app.after(ms, func, *args), key=key)
+
+    def pending(self):
+        with self._lock:
+            return len(self._order)
+
+    def _next(self):
+        with self._lock:
+            if not self._order:
+                return None
+            key, func, args = self._order.popleft()
+            if key is not None:
+                func, args = self._keyed.pop(key)
+            return func, args
+
+    def _pump(self):
+        deadline = time.perf_counter() + self.budget
+        ran = False
+        while time.perf_counter() < deadline:
+            job = self._next()
+            if job is None:
+                break
+            ran = True
+            func, args = job
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"UI dispatch error ({getattr(func, '__qualname__', func)}): {e}")
+        if ran or self.pending():
+            self._interval = BUSY_INTERVAL_MS
+        else:
+            self._interval = min(IDLE_INTERVAL_MS, self._interval * 2)
+        try:
+            self.app.after(self._interval, self._pump)
+        except Exception:
+            # app destroyed
+            self._running = False
+
+
+# Global dispatcher instance
+ui_dispatcher = None
+
+def install_ui_dispatcher(app):
+    """Create and start the dispatcher for the app (on the Tk thread)."""
+    global ui_dispatcher
+    ui_dispatcher = UIDispatcher(app)
+    ui_dispatcher.start()
+    return ui_dispatcher
+
+def get_ui_dispatcher():
+    return ui_dispatcher
+
+def post_to_ui(func, *args, key=None):
+    """Run func(*args) on the Tk thread (see UIDispatcher.post)."""
+    if ui_dispatcher is None:
+        if threading.current_thread() is threading.main_thread():
+            # scripts and benchmarks without an app: nothing to hop to
+            func(*args)
+            return
+        raise RuntimeError("post_to_ui() called before install_ui_dispatcher(app)")
+    ui_dispatcher.post(func, *args, key=key)